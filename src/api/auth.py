@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import cached_property
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -100,8 +101,14 @@ class CredentialManager:
     def __init__(self):
         self._key_file = Path(settings.data_dir) / ".auth_key"
         self._credentials_file = Path(settings.data_dir) / ".credentials"
-        self._fernet = self._get_or_create_key()
-        
+
+    @cached_property
+    def _fernet(self) -> Fernet:
+        """Cipher built lazily on first use and cached for the lifetime
+        of the manager, so key-file IO and key setup are paid once — and
+        not at all for commands that never touch credentials."""
+        return self._get_or_create_key()
+
     def _get_or_create_key(self) -> Fernet:
         """Get existing encryption key or create a new one."""
         if self._key_file.exists():
@@ -59,16 +59,15 @@ class PolloClient:
     def _log_api_usage(self, cost: float = 0.0, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Log API usage for cost tracking."""
         try:
-            db = next(get_db())
-            usage = APIUsage(
-                provider=APIProvider.POLLO_AI,
-                endpoint=APIEndpoint.VIDEO_GENERATION,
-                cost=cost,
-                request_metadata=metadata or {}
-            )
-            db.add(usage)
-            db.commit()
-            db.close()
+            with get_db() as db:
+                usage = APIUsage(
+                    provider=APIProvider.POLLO_AI,
+                    endpoint=APIEndpoint.VIDEO_GENERATION,
+                    cost=cost,
+                    request_metadata=metadata or {}
+                )
+                db.add(usage)
+                db.commit()
         except Exception as e:
             logger.error(f"Failed to log API usage: {e}")
     
@@ -112,16 +112,15 @@ class TwitterAPI:
                       metadata: Optional[Dict[str, Any]] = None) -> None:
         """Log API usage for cost tracking."""
         try:
-            db = next(get_db())
-            usage = APIUsage(
-                provider=APIProvider.TWITTER,
-                endpoint=endpoint,
-                cost=cost,
-                request_metadata=metadata or {}
-            )
-            db.add(usage)
-            db.commit()
-            db.close()
+            with get_db() as db:
+                usage = APIUsage(
+                    provider=APIProvider.TWITTER,
+                    endpoint=endpoint,
+                    cost=cost,
+                    request_metadata=metadata or {}
+                )
+                db.add(usage)
+                db.commit()
         except Exception as e:
             logger.error(f"Failed to log API usage: {e}")
     
@@ -62,7 +62,11 @@ def list_hooks(pattern_type: Optional[str], min_views: Optional[int], tags: Opti
     """List available hooks with filters."""
     try:
         manager = get_hook_manager()
-        
+
+        # Derived template columns are refreshed lazily at read time;
+        # fold the latest usage aggregates in before rendering them
+        manager.refresh_template_stats()
+
         # Parse tags if provided
         tag_list = [t.strip() for t in tags.split(',')] if tags else None
         
@@ -332,7 +336,11 @@ def hook_performance(hook_id: Optional[int], top: int):
     """View hook performance statistics."""
     try:
         manager = get_hook_manager()
-        
+
+        # Fold the latest usage aggregates into the template columns the
+        # ranking and table below read
+        manager.refresh_template_stats()
+
         if hook_id:
             # Show specific hook performance
             performance = manager.get_hook_performance(hook_id)
@@ -17,6 +17,7 @@ from src.cli.hook_commands import hooks
 from src.core.content_generator import content_generator
 from src.core.tweet_manager import tweet_manager
 from src.api.auth import auth_manager
+from src.models import ContentType, TweetStatus
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +28,7 @@ logging.basicConfig(
 )
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 
 @click.group()
@@ -64,7 +66,6 @@ def create(content: str, content_type: str, use_hook: int = None, hook_type: str
     
     Optionally apply high-performing hooks to enhance engagement."""
     try:
-        from src.models import ContentType
         from src.core.hook_manager import get_hook_manager
         
         # Handle hook application if requested
@@ -127,7 +128,7 @@ def create(content: str, content_type: str, use_hook: int = None, hook_type: str
         
     except Exception as e:
         console.print(f"[red]Error creating tweet: {str(e)}[/red]")
-        logging.error(f"Error in create command: {e}")
+        logger.error("Error in create command: %s", e)
 
 
 @cli.command()
@@ -140,8 +141,7 @@ def schedule(content: str, time: str, media: str, content_type: str) -> None:
     try:
         from datetime import datetime
         from pathlib import Path
-        from src.models import ContentType
-        
+
         # Parse scheduled time if provided
         scheduled_time = None
         if time:
@@ -184,7 +184,7 @@ def schedule(content: str, time: str, media: str, content_type: str) -> None:
     
     except Exception as e:
         console.print(f"[red]Error scheduling tweet: {str(e)}[/red]")
-        logging.error(f"Error in schedule command: {e}")
+        logger.error("Error in schedule command: %s", e)
 
 
 @cli.command()
@@ -200,8 +200,7 @@ def post(content: str, media: str, content_type: str) -> None:
     
     try:
         from pathlib import Path
-        from src.models import ContentType
-        
+
         console.print("[bold green]Posting tweet immediately...[/bold green]")
         console.print(f"Content: [white]{content}[/white]")
         console.print(f"Characters: {len(content)}/280")
@@ -239,7 +238,7 @@ def post(content: str, media: str, content_type: str) -> None:
     
     except Exception as e:
         console.print(f"[red]Error posting tweet: {str(e)}[/red]")
-        logging.error(f"Error in post command: {e}")
+        logger.error("Error in post command: %s", e)
 
 
 @cli.group()
@@ -254,8 +253,6 @@ def queue() -> None:
 def queue_list(status: str, limit: int) -> None:
     """List tweets in the queue."""
     try:
-        from src.models import TweetStatus
-        
         # Get status filter
         status_filter = None
         if status:
@@ -279,8 +276,8 @@ def queue_list(status: str, limit: int) -> None:
         
         for tweet in tweets:
             # Format scheduled time
-            scheduled = "Now" if tweet['status'] == 'posted' and tweet['posted_time'] else \
-                       tweet['scheduled_time'][:16] if tweet['scheduled_time'] else "-"
+            scheduled = "Now" if tweet.status == 'posted' and tweet.posted_time else \
+                       tweet.scheduled_time[:16] if tweet.scheduled_time else "-"
             
             # Status with emoji
             status_display = {
@@ -289,17 +286,17 @@ def queue_list(status: str, limit: int) -> None:
                 'approved': '✅ Approved',
                 'posted': '🚀 Posted',
                 'failed': '❌ Failed'
-            }.get(tweet['status'], tweet['status'])
+            }.get(tweet.status, tweet.status)
             
             # Media indicator
-            media_indicator = "📷" if tweet['has_media'] else ""
+            media_indicator = "📷" if tweet.has_media else ""
             
             table.add_row(
-                str(tweet['id']),
-                tweet['content'],
+                str(tweet.id),
+                tweet.content,
                 status_display,
                 scheduled,
-                tweet['content_type'],
+                tweet.content_type,
                 media_indicator
             )
         
@@ -313,7 +310,7 @@ def queue_list(status: str, limit: int) -> None:
     
     except Exception as e:
         console.print(f"[red]Error listing queue: {str(e)}[/red]")
-        logging.error(f"Error in queue list command: {e}")
+        logger.error("Error in queue list command: %s", e)
 
 
 @queue.command("approve")
@@ -331,7 +328,7 @@ def queue_approve(tweet_id: int) -> None:
     
     except Exception as e:
         console.print(f"[red]Error approving tweet: {str(e)}[/red]")
-        logging.error(f"Error in queue approve command: {e}")
+        logger.error("Error in queue approve command: %s", e)
 
 
 @queue.command("post")
@@ -359,7 +356,7 @@ def queue_post(tweet_id: int, force: bool) -> None:
     
     except Exception as e:
         console.print(f"[red]Error posting tweet: {str(e)}[/red]")
-        logging.error(f"Error in queue post command: {e}")
+        logger.error("Error in queue post command: %s", e)
 
 
 @queue.command("delete")
@@ -379,7 +376,7 @@ def queue_delete(tweet_id: int, force: bool) -> None:
     
     except Exception as e:
         console.print(f"[red]Error deleting tweet: {str(e)}[/red]")
-        logging.error(f"Error in queue delete command: {e}")
+        logger.error("Error in queue delete command: %s", e)
 
 
 @queue.command("show")
@@ -398,8 +395,8 @@ def queue_show(tweet_id: int) -> None:
         console.print()
         
         # Status and timing
-        console.print(f"Status: {tweet.status.value}")
-        console.print(f"Type: {tweet.content_type.value}")
+        console.print(f"Status: {tweet.status}")
+        console.print(f"Type: {tweet.content_type}")
         console.print(f"Characters: {len(tweet.content)}/280")
         console.print(f"Created: {tweet.created_at}")
         
@@ -419,7 +416,7 @@ def queue_show(tweet_id: int) -> None:
         if tweet.media_items:
             console.print(f"\n[dim]Media ({len(tweet.media_items)}):[/dim]")
             for media in tweet.media_items:
-                console.print(f"  {media.filename} ({media.media_type.value})")
+                console.print(f"  {media.filename} ({media.media_type})")
         
         # Twitter info
         if tweet.twitter_id:
@@ -437,7 +434,7 @@ def queue_show(tweet_id: int) -> None:
     
     except Exception as e:
         console.print(f"[red]Error showing tweet: {str(e)}[/red]")
-        logging.error(f"Error in queue show command: {e}")
+        logger.error("Error in queue show command: %s", e)
 
 
 @cli.command()
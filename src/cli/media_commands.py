@@ -1,5 +1,8 @@
 """Media generation and management CLI commands."""
 
+import json
+import sys
+
 import click
 from rich.console import Console
 from pathlib import Path
@@ -15,6 +18,12 @@ from src.core.tweet_manager import tweet_manager
 console = Console()
 
 
+def _emit_json(payload: dict) -> None:
+    """Write a single compact JSON object to stdout in one flush."""
+    sys.stdout.write(json.dumps(payload, separators=(',', ':')) + '\n')
+    sys.stdout.flush()
+
+
 @click.group()
 def media() -> None:
     """Manage media generation and attachments."""
@@ -27,11 +36,16 @@ def media() -> None:
 @click.option("--quality", type=click.Choice(["standard", "hd"]), default="standard")
 @click.option("--save-as", help="Filename to save the image")
 @click.option("--tweet-id", type=int, help="Tweet ID to attach the image to")
-def generate_image(prompt: str, size: str, quality: str, save_as: str, tweet_id: int) -> None:
+@click.option("--json", "json_output", is_flag=True, help="Suppress console output and emit a single JSON result")
+def generate_image(prompt: str, size: str, quality: str, save_as: str, tweet_id: int, json_output: bool) -> None:
     """Generate an image using DALL-E 3."""
+    console.quiet = json_output
+
     # Check if OpenAI is configured
     if not auth_manager.is_provider_configured('openai'):
         console.print("[red]OpenAI not configured. Run 'x-scheduler auth setup openai' first.[/red]")
+        if json_output:
+            _emit_json({'error': 'OpenAI not configured'})
         return
     
     console.print(f"[bold green]Generating image...[/bold green]")
@@ -41,9 +55,11 @@ def generate_image(prompt: str, size: str, quality: str, save_as: str, tweet_id:
     try:
         # Generate image
         result = openai_client.generate_image(prompt, size, quality)
-        
+
         if not result:
             console.print("[red]Failed to generate image[/red]")
+            if json_output:
+                _emit_json({'error': 'Failed to generate image'})
             return
         
         console.print(f"[green]✓ Image generated successfully![/green]")
@@ -75,23 +91,36 @@ def generate_image(prompt: str, size: str, quality: str, save_as: str, tweet_id:
         console.print(f"[green]✓ Image saved as: {file_path}[/green]")
         
         # Attach to tweet if requested
+        attached = False
         if tweet_id:
             console.print(f"Attaching to tweet {tweet_id}...")
-            success = tweet_manager.attach_media(tweet_id, file_path, alt_text=prompt[:1000])
-            
-            if success:
+            attached = tweet_manager.attach_media(tweet_id, file_path, alt_text=prompt[:1000])
+
+            if attached:
                 console.print(f"[green]✓ Image attached to tweet {tweet_id}[/green]")
             else:
                 console.print(f"[red]✗ Failed to attach image to tweet {tweet_id}[/red]")
-        
-        # Output path for Claude Code
-        print(f"\nIMAGE_PATH={file_path}")
-        
-        if result.get('revised_prompt'):
-            console.print(f"\n[dim]Revised prompt: {result['revised_prompt']}[/dim]")
-    
+
+        if json_output:
+            # Single write instead of interleaved Rich prints for scripted pipelines
+            _emit_json({
+                'image_path': str(file_path),
+                'cost': result['cost'],
+                'tweet_id': tweet_id,
+                'attached': attached,
+                'revised_prompt': result.get('revised_prompt'),
+            })
+        else:
+            # Output path for Claude Code
+            print(f"\nIMAGE_PATH={file_path}")
+
+            if result.get('revised_prompt'):
+                console.print(f"\n[dim]Revised prompt: {result['revised_prompt']}[/dim]")
+
     except Exception as e:
         console.print(f"[red]Error generating image: {str(e)}[/red]")
+        if json_output:
+            _emit_json({'error': str(e)})
 
 
 @media.command("generate-video")
@@ -101,11 +130,16 @@ def generate_image(prompt: str, size: str, quality: str, save_as: str, tweet_id:
 @click.option("--style", type=click.Choice(["realistic", "cartoon", "anime", "abstract"]), default="realistic")
 @click.option("--save-as", help="Filename to save the video")
 @click.option("--tweet-id", type=int, help="Tweet ID to attach the video to")
-def generate_video(prompt: str, duration: int, quality: str, style: str, save_as: str, tweet_id: int) -> None:
+@click.option("--json", "json_output", is_flag=True, help="Suppress console output and emit a single JSON result")
+def generate_video(prompt: str, duration: int, quality: str, style: str, save_as: str, tweet_id: int, json_output: bool) -> None:
     """Generate a video using Pollo.ai."""
+    console.quiet = json_output
+
     # Check if Pollo.ai is configured
     if not auth_manager.is_provider_configured('pollo'):
         console.print("[red]Pollo.ai not configured. Run 'x-scheduler auth setup pollo' first.[/red]")
+        if json_output:
+            _emit_json({'error': 'Pollo.ai not configured'})
         return
     
     console.print(f"[bold green]Generating video...[/bold green]")
@@ -118,6 +152,8 @@ def generate_video(prompt: str, duration: int, quality: str, style: str, save_as
         
         if not result:
             console.print("[red]Failed to generate video[/red]")
+            if json_output:
+                _emit_json({'error': 'Failed to generate video'})
             return
         
         console.print(f"[green]✓ Video generation started![/green]")
@@ -137,6 +173,8 @@ def generate_video(prompt: str, duration: int, quality: str, style: str, save_as
                 break
             elif status and status['status'] == 'failed':
                 console.print(f"[red]Video generation failed: {status.get('error_message')}[/red]")
+                if json_output:
+                    _emit_json({'error': f"Video generation failed: {status.get('error_message')}"})
                 return
             
             time.sleep(5)
@@ -144,6 +182,8 @@ def generate_video(prompt: str, duration: int, quality: str, style: str, save_as
         
         if not video_url:
             console.print("[red]Video generation timed out[/red]")
+            if json_output:
+                _emit_json({'error': 'Video generation timed out'})
             return
         
         # Download video
@@ -160,24 +200,39 @@ def generate_video(prompt: str, duration: int, quality: str, style: str, save_as
         
         if success:
             console.print(f"[green]✓ Video saved as: {file_path}[/green]")
-            
+
             # Attach to tweet if requested
+            attached = False
             if tweet_id:
                 console.print(f"Attaching to tweet {tweet_id}...")
-                success = tweet_manager.attach_media(tweet_id, file_path, alt_text=prompt[:1000])
-                
-                if success:
+                attached = tweet_manager.attach_media(tweet_id, file_path, alt_text=prompt[:1000])
+
+                if attached:
                     console.print(f"[green]✓ Video attached to tweet {tweet_id}[/green]")
                 else:
                     console.print(f"[red]✗ Failed to attach video to tweet {tweet_id}[/red]")
-            
-            # Output path for Claude Code
-            print(f"\nVIDEO_PATH={file_path}")
+
+            if json_output:
+                # Single write instead of interleaved Rich prints for scripted pipelines
+                _emit_json({
+                    'video_path': str(file_path),
+                    'video_id': result['video_id'],
+                    'cost': result['cost'],
+                    'tweet_id': tweet_id,
+                    'attached': attached,
+                })
+            else:
+                # Output path for Claude Code
+                print(f"\nVIDEO_PATH={file_path}")
         else:
             console.print("[red]Failed to download video[/red]")
-    
+            if json_output:
+                _emit_json({'error': 'Failed to download video'})
+
     except Exception as e:
         console.print(f"[red]Error generating video: {str(e)}[/red]")
+        if json_output:
+            _emit_json({'error': str(e)})
 
 
 @media.command("attach")
@@ -213,47 +268,44 @@ def list_media(tweet_id: int) -> None:
     try:
         from src.models import get_db, Media, Tweet
         
-        db = next(get_db())
-        
-        if tweet_id:
-            # Show media for specific tweet
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            if not tweet:
-                console.print(f"[red]Tweet {tweet_id} not found[/red]")
-                return
+        with get_db() as db:
+            if tweet_id:
+                # Show media for specific tweet
+                tweet = db.query(Tweet).filter_by(id=tweet_id).first()
+                if not tweet:
+                    console.print(f"[red]Tweet {tweet_id} not found[/red]")
+                    return
             
-            if not tweet.media_items:
-                console.print(f"[yellow]No media attached to tweet {tweet_id}[/yellow]")
-                return
+                if not tweet.media_items:
+                    console.print(f"[yellow]No media attached to tweet {tweet_id}[/yellow]")
+                    return
             
-            console.print(f"\n[bold]Media for Tweet {tweet_id}:[/bold]")
-            for media in tweet.media_items:
-                console.print(f"\n{media.filename}")
-                console.print(f"  Type: {media.media_type.value}")
-                console.print(f"  Source: {media.media_source.value}")
-                if media.generation_cost > 0:
-                    console.print(f"  Cost: ${media.generation_cost:.4f}")
-                if media.alt_text:
-                    console.print(f"  Alt text: {media.alt_text[:50]}...")
-        else:
-            # Show all media
-            media_items = db.query(Media).order_by(Media.created_at.desc()).limit(20).all()
+                console.print(f"\n[bold]Media for Tweet {tweet_id}:[/bold]")
+                for media in tweet.media_items:
+                    console.print(f"\n{media.filename}")
+                    console.print(f"  Type: {media.media_type}")
+                    console.print(f"  Source: {media.media_source}")
+                    if media.generation_cost > 0:
+                        console.print(f"  Cost: ${media.generation_cost:.4f}")
+                    if media.alt_text:
+                        console.print(f"  Alt text: {media.alt_text[:50]}...")
+            else:
+                # Show all media
+                media_items = db.query(Media).order_by(Media.created_at.desc()).limit(20).all()
             
-            if not media_items:
-                console.print("[yellow]No media files found[/yellow]")
-                return
+                if not media_items:
+                    console.print("[yellow]No media files found[/yellow]")
+                    return
             
-            console.print(f"\n[bold]Recent Media Files:[/bold]")
-            for media in media_items:
-                console.print(f"\n{media.filename}")
-                console.print(f"  Type: {media.media_type.value}")
-                console.print(f"  Source: {media.media_source.value}")
-                if media.tweet_id:
-                    console.print(f"  Tweet ID: {media.tweet_id}")
-                if media.generation_cost > 0:
-                    console.print(f"  Cost: ${media.generation_cost:.4f}")
-        
-        db.close()
+                console.print(f"\n[bold]Recent Media Files:[/bold]")
+                for media in media_items:
+                    console.print(f"\n{media.filename}")
+                    console.print(f"  Type: {media.media_type}")
+                    console.print(f"  Source: {media.media_source}")
+                    if media.tweet_id:
+                        console.print(f"  Tweet ID: {media.tweet_id}")
+                    if media.generation_cost > 0:
+                        console.print(f"  Cost: ${media.generation_cost:.4f}")
         
     except Exception as e:
         console.print(f"[red]Error listing media: {str(e)}[/red]")
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Configuration management for X-Scheduler."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -58,11 +59,13 @@ class Settings(BaseSettings):
     
     @field_validator("data_dir", "media_dir", mode="before")
     @classmethod
-    def create_directories(cls, v: str) -> Path:
-        """Create directories if they don't exist."""
-        path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+    def coerce_path(cls, v: str) -> Path:
+        """Coerce directory values to Path.
+
+        Directories are created lazily by `initialize_database` rather than
+        on every Settings construction, avoiding mkdir syscalls at import time.
+        """
+        return Path(v)
     
     @property
     def twitter_configured(self) -> bool:
@@ -84,10 +87,21 @@ class Settings(BaseSettings):
         """Check if Pollo.ai API is configured."""
         return bool(self.pollo_api_key)
     
+    @cached_property
+    def _default_post_times_list(self) -> list[str]:
+        """Parsed default posting times, split once per instance."""
+        return [time.strip() for time in self.default_post_times.split(",")]
+
     def get_default_post_times(self) -> list[str]:
         """Get default posting times as a list."""
-        return [time.strip() for time in self.default_post_times.split(",")]
+        return self._default_post_times_list
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached settings instance (env parsed once per process)."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,6 +1,9 @@
 """AI-powered content generation service."""
 
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -13,11 +16,28 @@ from src.core.tweet_manager import tweet_manager
 logger = logging.getLogger(__name__)
 
 
+# Seconds a cached generation-stats snapshot stays fresh; templates are
+# effectively static and cache until explicitly invalidated
+_STATS_TTL = 60.0
+
+# Compiled once: hashtag checks run through C-level regex matching, and
+# a bare '#' without a word after it no longer counts as a hashtag
+_HASHTAG_RE = re.compile(r"#\w+")
+
+
 class ContentGenerator:
     """Generates tweet content using AI with style matching."""
     
     def __init__(self):
-        pass
+        self._templates_cache: Optional[List[Dict[str, Any]]] = None
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
+
+    def clear_caches(self) -> None:
+        """Drop memoized templates and stats (call after DB mutations)."""
+        self._templates_cache = None
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
     
     def generate_tweets(self, topic: str, style: str = "personal", count: int = 1,
                        model: str = "gpt-4", save_to_db: bool = True) -> List[Dict[str, Any]]:
@@ -29,12 +49,29 @@ class ContentGenerator:
             hashtag_count = get_setting(SettingCategory.AI, "hashtag_count", 3)
             
             # Generate content using OpenAI
-            generated_tweets = openai_client.generate_tweet_content(
-                prompt=topic,
-                style=style,
-                model=model,
-                count=count
-            )
+            if count > 1:
+                # One request per tweet, issued concurrently: latency is bounded
+                # by the slowest call instead of the sum of all round-trips
+                with ThreadPoolExecutor(max_workers=min(count, 8)) as executor:
+                    batches = list(executor.map(
+                        lambda _: openai_client.generate_tweet_content(
+                            prompt=topic,
+                            style=style,
+                            model=model,
+                            count=1
+                        ),
+                        range(count)
+                    ))
+                generated_tweets = [tweet for batch in batches for tweet in batch]
+                for i, tweet_data in enumerate(generated_tweets, 1):
+                    tweet_data['index'] = i
+            else:
+                generated_tweets = openai_client.generate_tweet_content(
+                    prompt=topic,
+                    style=style,
+                    model=model,
+                    count=count
+                )
             
             if not generated_tweets:
                 logger.error("No tweets generated by OpenAI")
@@ -102,11 +139,9 @@ class ContentGenerator:
                              save_to_db: bool = True) -> List[Dict[str, Any]]:
         """Generate tweets using a style template."""
         try:
-            db = next(get_db())
-            
-            # Get template
-            template = db.query(StyleTemplate).filter_by(name=template_name, is_active=True).first()
-            db.close()
+            with get_db() as db:
+                # Get template
+                template = db.query(StyleTemplate).filter_by(name=template_name, is_active=True).first()
             
             if not template:
                 logger.error(f"Style template '{template_name}' not found")
@@ -128,10 +163,10 @@ class ContentGenerator:
             
             # Update template usage
             try:
-                db = next(get_db())
-                template.times_used += 1
-                db.commit()
-                db.close()
+                with get_db() as db:
+                    db.add(template)
+                    template.times_used += 1
+                    db.commit()
             except Exception as e:
                 logger.error(f"Failed to update template usage: {e}")
             
@@ -189,11 +224,11 @@ class ContentGenerator:
     
     def _has_hashtags(self, content: str) -> bool:
         """Check if content contains hashtags."""
-        return '#' in content
+        return _HASHTAG_RE.search(content) is not None
     
     def _count_hashtags(self, content: str) -> int:
         """Count hashtags in content."""
-        return content.count('#')
+        return len(_HASHTAG_RE.findall(content))
     
     def _add_hashtags(self, content: str, topic: str, max_hashtags: int = 3) -> str:
         """Add relevant hashtags to content."""
@@ -221,20 +256,18 @@ class ContentGenerator:
         """Truncate content to fit character limit."""
         if len(content) <= max_length:
             return content
-        
-        # Try to truncate at word boundary
-        truncated = content[:max_length]
-        
-        # Find last space before the limit
-        last_space = truncated.rfind(' ')
-        if last_space > max_length * 0.8:  # Only truncate at word if it's not too short
-            truncated = truncated[:last_space]
-        
-        # Add ellipsis if we truncated
-        if len(truncated) < len(content):
-            truncated = truncated.rstrip() + "..."
-        
-        return truncated
+
+        # Reserve room for the ellipsis so the result actually fits the
+        # limit (the old version could come back three chars over), and
+        # cut at the last word boundary unless that loses too much text
+        budget = max_length - 3
+        last_space = content.rfind(' ', 0, budget)
+        if last_space > budget * 0.8:
+            truncated = content[:last_space]
+        else:
+            truncated = content[:budget]
+
+        return truncated.rstrip() + "..."
     
     def analyze_content_style(self, text_samples: List[str]) -> Optional[Dict[str, Any]]:
         """Analyze writing style from text samples."""
@@ -266,36 +299,35 @@ class ContentGenerator:
                 logger.error("Failed to analyze style for template creation")
                 return False
             
-            db = next(get_db())
-            
-            # Check if template already exists
-            existing = db.query(StyleTemplate).filter_by(name=name).first()
-            if existing:
-                logger.error(f"Style template '{name}' already exists")
-                db.close()
-                return False
-            
-            # Create template
-            template = StyleTemplate(
-                name=name,
-                description=description,
-                tone=analysis.get('tone', 'conversational'),
-                voice=analysis.get('voice', 'friendly'),
-                opening_patterns=analysis.get('common_phrases', [])[:5],
-                closing_patterns=[],  # Would need more sophisticated analysis
-                vocabulary_level=analysis.get('vocabulary_level', 'medium'),
-                sentence_structure=analysis.get('sentence_structure', 'varied'),
-                use_emojis=analysis.get('emoji_usage', 'none') != 'none',
-                emoji_frequency=0.2 if analysis.get('emoji_usage', 'none') != 'none' else 0.0,
-                use_hashtags=analysis.get('hashtag_style', 'none') != 'none',
-                hashtag_style=analysis.get('hashtag_style', 'lowercase'),
-                example_tweets=text_samples[:3]  # Store first 3 as examples
-            )
-            
-            db.add(template)
-            db.commit()
-            db.close()
-            
+            with get_db() as db:
+                # Existence check only: fetch just the id rather than
+                # hydrating the full template row
+                existing = db.query(StyleTemplate.id).filter_by(name=name).scalar()
+                if existing is not None:
+                    logger.error(f"Style template '{name}' already exists")
+                    return False
+                
+                # Create template
+                template = StyleTemplate(
+                    name=name,
+                    description=description,
+                    tone=analysis.get('tone', 'conversational'),
+                    voice=analysis.get('voice', 'friendly'),
+                    opening_patterns=analysis.get('common_phrases', [])[:5],
+                    closing_patterns=[],  # Would need more sophisticated analysis
+                    vocabulary_level=analysis.get('vocabulary_level', 'medium'),
+                    sentence_structure=analysis.get('sentence_structure', 'varied'),
+                    use_emojis=analysis.get('emoji_usage', 'none') != 'none',
+                    emoji_frequency=0.2 if analysis.get('emoji_usage', 'none') != 'none' else 0.0,
+                    use_hashtags=analysis.get('hashtag_style', 'none') != 'none',
+                    hashtag_style=analysis.get('hashtag_style', 'lowercase'),
+                    example_tweets=text_samples[:3]  # Store first 3 as examples
+                )
+                
+                db.add(template)
+                db.commit()
+
+            self._templates_cache = None
             logger.info(f"Created style template '{name}'")
             return True
             
@@ -304,28 +336,35 @@ class ContentGenerator:
             return False
     
     def get_style_templates(self) -> List[Dict[str, Any]]:
-        """Get all available style templates."""
+        """Get all available style templates.
+
+        Results are memoized per process — template rows change only
+        through create_style_template, which invalidates the cache — so
+        repeated callers skip the query and dict building entirely.
+        """
+        if self._templates_cache is not None:
+            return self._templates_cache
         try:
-            db = next(get_db())
-            templates = db.query(StyleTemplate).filter_by(is_active=True).all()
-            
-            result = []
-            for template in templates:
-                template_data = {
-                    'id': template.id,
-                    'name': template.name,
-                    'description': template.description,
-                    'tone': template.tone,
-                    'voice': template.voice,
-                    'vocabulary_level': template.vocabulary_level,
-                    'use_emojis': template.use_emojis,
-                    'use_hashtags': template.use_hashtags,
-                    'times_used': template.times_used,
-                    'created_at': template.created_at.isoformat()
-                }
-                result.append(template_data)
-            
-            db.close()
+            with get_db() as db:
+                templates = db.query(StyleTemplate).filter_by(is_active=True).all()
+                
+                result = []
+                for template in templates:
+                    template_data = {
+                        'id': template.id,
+                        'name': template.name,
+                        'description': template.description,
+                        'tone': template.tone,
+                        'voice': template.voice,
+                        'vocabulary_level': template.vocabulary_level,
+                        'use_emojis': template.use_emojis,
+                        'use_hashtags': template.use_hashtags,
+                        'times_used': template.times_used,
+                        'created_at': template.created_at.isoformat()
+                    }
+                    result.append(template_data)
+            
+            self._templates_cache = result
             return result
             
         except Exception as e:
@@ -333,28 +372,32 @@ class ContentGenerator:
             return []
     
     def get_generation_stats(self) -> Dict[str, Any]:
-        """Get content generation statistics."""
+        """Get content generation statistics.
+
+        Snapshots are cached for a short TTL since stats drift as tweets
+        are generated; within the window repeat calls are a dict lookup.
+        """
+        if (self._stats_cache is not None
+                and time.monotonic() - self._stats_cached_at < _STATS_TTL):
+            return self._stats_cache
         try:
             from src.models import Tweet
             
-            db = next(get_db())
-            
-            # Count AI generated tweets
-            total_ai_tweets = db.query(Tweet).filter_by(ai_generated=True).count()
-            
-            # Count by content type
-            content_type_counts = {}
-            for content_type in ['personal', 'professional', 'casual', 'educational']:
-                count = db.query(Tweet).filter_by(ai_generated=True).filter(
-                    Tweet.content_type == content_type
-                ).count()
-                content_type_counts[content_type] = count
-            
-            # Total generation cost
-            from sqlalchemy import func
-            total_cost = db.query(func.sum(Tweet.generation_cost)).filter_by(ai_generated=True).scalar() or 0.0
-            
-            db.close()
+            with get_db() as db:
+                # Count AI generated tweets
+                total_ai_tweets = db.query(Tweet).filter_by(ai_generated=True).count()
+                
+                # Count by content type
+                content_type_counts = {}
+                for content_type in ['personal', 'professional', 'casual', 'educational']:
+                    count = db.query(Tweet).filter_by(ai_generated=True).filter(
+                        Tweet.content_type == content_type
+                    ).count()
+                    content_type_counts[content_type] = count
+                
+                # Total generation cost
+                from sqlalchemy import func
+                total_cost = db.query(func.sum(Tweet.generation_cost)).filter_by(ai_generated=True).scalar() or 0.0
             
             stats = {
                 'total_ai_generated': total_ai_tweets,
@@ -363,6 +406,8 @@ class ContentGenerator:
                 'average_cost_per_tweet': round(total_cost / total_ai_tweets, 4) if total_ai_tweets > 0 else 0.0
             }
             
+            self._stats_cache = stats
+            self._stats_cached_at = time.monotonic()
             return stats
             
         except Exception as e:
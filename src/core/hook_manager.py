@@ -4,21 +4,167 @@ import json
 import logging
 import random
 import re
+import threading
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Iterator, List, Dict, Optional, Any, Tuple
 
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+try:
+    import ijson
+except ImportError:  # Optional; falls back to json.load for whole-file parsing
+    ijson = None
+
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import case, desc, event, func, lambda_stmt, or_, select, text
 
 from src.models import (
-    HookTemplate, HookUsage, HookCategory, 
-    HookPatternType, Tweet, TweetStatus, get_db
+    HookTemplate, HookUsage, HookCategory,
+    HookPatternType, Tweet, TweetStatus, ScopedSession, get_db
 )
+from src.models.base import engine
+from src.core.database import bulk_load
 
 logger = logging.getLogger(__name__)
 
 
+# Precompiled patterns and phrase tables for the per-tweet analysis hot path
+_RESULTS_RE = re.compile(r'\$[\d,]+[kK]?|\d+[kK]\s*(monthly|per|/)')
+
+# Single alternation for attention-grabbing elements; one scan of the first
+# line replaces a separate re.search per element. Weights mirror the old
+# per-element scoring.
+_ATTN_RE = re.compile(
+    r'(?P<caps>[A-Z]{3,})'
+    r'|(?P<emoji>[😀-🙏🌀-🗿🚀-🛿✂-➿])'
+    r'|(?P<numbers>\d+)'
+    r'|(?P<exclamation>!)'
+)
+_ATTN_WEIGHTS = {
+    'caps': 2,
+    'emoji': 1,
+    'numbers': 2,
+    'question': 1.5,
+    'exclamation': 1,
+}
+_LIST_RE = re.compile(r'\d+\s+\w+\s+that')
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
+_VALUE_GIVEAWAY_PHRASES = ('comment', "i'll send", "i'll dm", 'repost')
+_SHOCK_PHRASES = ('holy', 'sh*t', 'insane', 'crazy', 'wtf')
+_AUTHORITY_PHRASES = ("i've cracked", "i've built", "i spent")
+_INSIDER_PHRASES = ('asked me not to', 'secretly', 'nobody talks')
+_TIME_SENSITIVE_PHRASES = ('free for', 'next 24', 'limited time')
+
+_SHOCK_INTROS = (
+    "HOLY SH*T..🤯",
+    "This is INSANE...",
+    "I can't believe this...",
+    "Mind = BLOWN 🤯",
+)
+
+# Adaptation templates filled in one format_map pass instead of repeated
+# f-string concatenation per call
+_VALUE_GIVEAWAY_TMPL = (
+    "{content}\n\n"
+    "Want {value}?\n\n"
+    "👉 RT + Like & {action} \"{keyword}\" and I'll DM it to you\n\n"
+    "(Must be following)"
+)
+_RESULTS_TMPL = "How I achieved {result} {timeframe}:\n\n{content}"
+_LIST_TMPL = "{number} {item_type} {benefit}:\n\n{content}"
+
+_TAG_KEYWORDS = {
+    'AI': ('ai', 'chatgpt', 'claude', 'openai', 'llm'),
+    'automation': ('automat', 'n8n', 'zapier', 'workflow'),
+    'coding': ('code', 'coding', 'developer', 'programming'),
+    'business': ('business', 'client', 'revenue', 'profit'),
+    'viral': ('viral', 'views', 'million'),
+}
+
+
+# Rows per bulk INSERT during imports; keeps memory O(batch) for large files
+_IMPORT_BATCH_SIZE = 10_000
+
+
+def _top_hooks_stmt(limit: int):
+    """Frozen statement for the active-hooks-by-engagement fetch.
+
+    lambda_stmt caches the compiled SQL across calls; limit is tracked as
+    a bind parameter, so the hot default paths of suggest_hooks and
+    list_hooks skip per-call SQL generation.
+    """
+    stmt = lambda_stmt(
+        lambda: select(HookTemplate)
+        .where(HookTemplate.is_active == True)  # noqa: E712
+        .order_by(desc(HookTemplate.avg_engagement_rate))
+    )
+    stmt += lambda s: s.limit(limit)
+    return stmt
+
+
+@dataclass
+class _TweetView:
+    """Precomputed views of one tweet shared across the analysis helpers.
+
+    Lowercased text and the first-line split are each computed once here
+    instead of once per helper. __slots__ skips the per-instance __dict__.
+    """
+
+    __slots__ = ('raw', 'lower', 'first_line', 'first_line_lower')
+
+    raw: str
+    lower: str
+    first_line: str
+    first_line_lower: str
+
+    @classmethod
+    def of(cls, text: str) -> '_TweetView':
+        first_line = text.split('\n')[0] if '\n' in text else text[:50]
+        return cls(text, text.lower(), first_line, first_line.lower())
+
+
+@event.listens_for(engine, "checkin")
+def _restore_durability_on_checkin(dbapi_connection, connection_record) -> None:
+    """Restore synchronous=NORMAL on connections bulk_mode relaxed.
+
+    The commit inside a bulk load returns the session's connection to
+    the pool before bulk_mode's finally runs, so the restore must
+    follow the connection itself: bulk_mode flags the pool record when
+    it sets OFF, and this hook clears the flag and the pragma whenever
+    that connection checks back in. OFF can therefore never leak to
+    unrelated work.
+    """
+    if connection_record.info.pop('bulk_sync_off', None):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+@contextmanager
+def bulk_mode(session: Session) -> Iterator[Session]:
+    """Relax SQLite durability settings for the duration of a bulk load.
+
+    OFF skips fsyncs entirely while the import runs; the checkin hook
+    above restores the engine-wide NORMAL default (set per connection
+    in src.models.base) on the exact connection that was relaxed, once
+    the session releases it.
+    """
+    connection = session.connection()
+    connection.connection.info['bulk_sync_off'] = True
+    connection.exec_driver_sql("PRAGMA synchronous=OFF")
+    try:
+        yield session
+    finally:
+        # A failed load leaves the session pending-rollback; clear it so
+        # the connection checks in (triggering the pragma restore)
+        # without raising over the original error
+        session.rollback()
+
+
 class HookManager:
     """Manages tweet hooks and pattern matching."""
     
@@ -27,8 +173,11 @@ class HookManager:
         if session:
             self.session = session
         else:
-            # Get a new database session
-            self.session = next(get_db())
+            # Reuse the thread-local session
+            self.session = ScopedSession()
+
+        # Read-through cache for hook lookups repeated during adapt/analyze
+        self._hook_cache: Dict[int, HookTemplate] = {}
     
     def import_hooks(self, file_path: str, format: str = 'json') -> int:
         """Import hooks from a file.
@@ -51,36 +200,60 @@ class HookManager:
         else:
             raise ValueError(f"Unsupported format: {format}")
     
+    def _iter_json_hooks(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield hook entries from a JSON file, streaming when possible.
+
+        With ijson installed, entries are parsed incrementally so memory
+        stays O(batch) for large exports; otherwise the whole file is
+        loaded with json.load.
+        """
+        if ijson is not None:
+            with open(path, 'rb') as f:
+                # Top-level array vs {"hooks": [...]} wrapper
+                first = f.read(1)
+                while first.isspace():
+                    first = f.read(1)
+                f.seek(0)
+                prefix = 'item' if first == b'[' else 'hooks.item'
+                yield from ijson.items(f, prefix)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            yield from (data if isinstance(data, list) else data.get('hooks', []))
+
     def _import_json_hooks(self, path: Path) -> int:
         """Import hooks from JSON file."""
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        def rows() -> Iterator[Dict[str, Any]]:
+            for hook_data in self._iter_json_hooks(path):
+                try:
+                    yield {
+                        'pattern_type': hook_data.get('pattern_type', 'custom'),
+                        'name': hook_data.get('name', ''),
+                        'hook_text': hook_data.get('hook_text', ''),
+                        'example_tweet': hook_data.get('example_tweet', ''),
+                        'structure_notes': hook_data.get('structure_notes', ''),
+                        'performance_metrics': hook_data.get('performance_metrics', {}),
+                        'min_views': hook_data.get('min_views', 0),
+                        'avg_engagement_rate': hook_data.get('avg_engagement_rate', 0.0),
+                        'tags': hook_data.get('tags', []),
+                        'use_cases': hook_data.get('use_cases', []),
+                        'target_audience': hook_data.get('target_audience', ''),
+                        'source': hook_data.get('source', str(path))
+                    }
+                except Exception as e:
+                    logger.error(f"Failed to import hook: {e}")
+
+        # Feed the (possibly streaming) parser into batched INSERTs
         imported = 0
-        hooks = data if isinstance(data, list) else data.get('hooks', [])
-        
-        for hook_data in hooks:
-            try:
-                hook = HookTemplate(
-                    pattern_type=hook_data.get('pattern_type', 'custom'),
-                    name=hook_data.get('name', ''),
-                    hook_text=hook_data.get('hook_text', ''),
-                    example_tweet=hook_data.get('example_tweet', ''),
-                    structure_notes=hook_data.get('structure_notes', ''),
-                    performance_metrics=hook_data.get('performance_metrics', {}),
-                    min_views=hook_data.get('min_views', 0),
-                    avg_engagement_rate=hook_data.get('avg_engagement_rate', 0.0),
-                    tags=hook_data.get('tags', []),
-                    use_cases=hook_data.get('use_cases', []),
-                    target_audience=hook_data.get('target_audience', ''),
-                    source=hook_data.get('source', str(path))
-                )
-                self.session.add(hook)
-                imported += 1
-            except Exception as e:
-                logger.error(f"Failed to import hook: {e}")
-        
-        self.session.commit()
+        rows_iter = rows()
+        with bulk_mode(self.session):
+            while True:
+                chunk = list(islice(rows_iter, _IMPORT_BATCH_SIZE))
+                if not chunk:
+                    break
+                imported += bulk_load(self.session, HookTemplate, chunk)
+            self.session.commit()
+
         logger.info(f"Imported {imported} hooks from {path}")
         return imported
     
@@ -89,16 +262,15 @@ class HookManager:
         content = path.read_text(encoding='utf-8')
         
         # Parse text file with pattern recognition
-        imported = 0
+        rows = []
         current_hook = None
-        
+
         for line in content.split('\n'):
             line = line.strip()
             if line.startswith('—') or not line:
                 if current_hook and current_hook.get('example_tweet'):
                     # Save the current hook
-                    self._save_hook_from_text(current_hook)
-                    imported += 1
+                    rows.append(self._hook_row_from_text(current_hook))
                 current_hook = None if line.startswith('—') else current_hook
             elif current_hook is None:
                 # Start new hook
@@ -106,83 +278,78 @@ class HookManager:
             else:
                 # Continue current hook
                 current_hook['example_tweet'] += '\n' + line
-        
+
         # Save last hook if exists
         if current_hook and current_hook.get('example_tweet'):
-            self._save_hook_from_text(current_hook)
-            imported += 1
-        
-        self.session.commit()
-        logger.info(f"Imported {imported} hooks from {path}")
-        return imported
-    
-    def _save_hook_from_text(self, hook_data: Dict[str, str]) -> None:
-        """Save a hook parsed from text."""
+            rows.append(self._hook_row_from_text(current_hook))
+
+        if rows:
+            with bulk_mode(self.session):
+                bulk_load(self.session, HookTemplate, rows)
+                self.session.commit()
+        logger.info(f"Imported {len(rows)} hooks from {path}")
+        return len(rows)
+
+    def _hook_row_from_text(self, hook_data: Dict[str, str]) -> Dict[str, Any]:
+        """Build a hook insert row from parsed text."""
         tweet_text = hook_data['example_tweet']
-        
+        view = _TweetView.of(tweet_text)
+
         # Analyze the tweet to determine pattern type
-        pattern_type = self._detect_pattern_type(tweet_text)
-        
+        pattern_type = self._detect_pattern_type(view)
+
         # Extract hook (first line or attention-grabbing part)
         lines = tweet_text.split('\n')
         hook_text = lines[0] if lines else tweet_text[:100]
-        
-        hook = HookTemplate(
-            pattern_type=pattern_type,
-            name=f"{pattern_type} hook",
-            hook_text=hook_text,
-            example_tweet=tweet_text,
-            tags=self._extract_tags(tweet_text),
-            source='text_import'
-        )
-        self.session.add(hook)
+
+        return {
+            'pattern_type': pattern_type,
+            'name': f"{pattern_type} hook",
+            'hook_text': hook_text,
+            'example_tweet': tweet_text,
+            'tags': self._extract_tags(view),
+            'source': 'text_import'
+        }
     
-    def _detect_pattern_type(self, text: str) -> str:
-        """Detect the pattern type from tweet text."""
-        text_lower = text.lower()
-        
-        if any(phrase in text_lower for phrase in ['comment', "i'll send", "i'll dm", 'repost']):
+    def _detect_pattern_type(self, view: _TweetView) -> str:
+        """Detect the pattern type from a tweet view."""
+        text_lower = view.lower
+
+        if any(phrase in text_lower for phrase in _VALUE_GIVEAWAY_PHRASES):
             return HookPatternType.VALUE_GIVEAWAY
-        elif any(phrase in text_lower for phrase in ['holy', 'sh*t', 'insane', 'crazy', 'wtf']):
+        elif any(phrase in text_lower for phrase in _SHOCK_PHRASES):
             return HookPatternType.SHOCK
-        elif re.search(r'\$[\d,]+[kK]?|\d+[kK]\s*(monthly|per|/)', text):
+        elif _RESULTS_RE.search(view.raw):
             return HookPatternType.RESULTS
-        elif any(phrase in text_lower for phrase in ["i've cracked", "i've built", "i spent"]):
+        elif any(phrase in text_lower for phrase in _AUTHORITY_PHRASES):
             return HookPatternType.AUTHORITY
-        elif any(phrase in text_lower for phrase in ['asked me not to', 'secretly', 'nobody talks']):
+        elif any(phrase in text_lower for phrase in _INSIDER_PHRASES):
             return HookPatternType.INSIDER
-        elif re.search(r'\d+\s+\w+\s+that', text_lower):
+        elif _LIST_RE.search(text_lower):
             return HookPatternType.LIST
-        elif any(phrase in text_lower for phrase in ['free for', 'next 24', 'limited time']):
+        elif any(phrase in text_lower for phrase in _TIME_SENSITIVE_PHRASES):
             return HookPatternType.TIME_SENSITIVE
-        elif text.startswith(('Why', 'How', 'What', 'When')):
+        elif view.raw.startswith(('Why', 'How', 'What', 'When')):
             return HookPatternType.QUESTION
         else:
             return 'custom'
-    
-    def _extract_tags(self, text: str) -> List[str]:
-        """Extract relevant tags from tweet text."""
+
+    def _extract_tags(self, view: _TweetView) -> List[str]:
+        """Extract relevant tags from a tweet view."""
         tags = []
-        
+
         # Extract hashtags
-        hashtags = re.findall(r'#(\w+)', text)
+        hashtags = _HASHTAG_RE.findall(view.raw)
         tags.extend(hashtags)
-        
+
         # Extract topic keywords
-        keywords = {
-            'AI': ['ai', 'chatgpt', 'claude', 'openai', 'llm'],
-            'automation': ['automat', 'n8n', 'zapier', 'workflow'],
-            'coding': ['code', 'coding', 'developer', 'programming'],
-            'business': ['business', 'client', 'revenue', 'profit'],
-            'viral': ['viral', 'views', 'million'],
-        }
-        
-        text_lower = text.lower()
-        for tag, patterns in keywords.items():
+        text_lower = view.lower
+        for tag, patterns in _TAG_KEYWORDS.items():
             if any(pattern in text_lower for pattern in patterns):
                 tags.append(tag)
-        
-        return list(set(tags))
+
+        # dict.fromkeys dedups in one hashed pass and keeps insertion order
+        return list(dict.fromkeys(tags))
     
     def suggest_hooks(
         self, 
@@ -210,40 +377,32 @@ class HookManager:
             query = query.filter(HookTemplate.pattern_type == pattern_type)
         
         if topic:
-            # Search in tags and use_cases
-            topic_lower = topic.lower()
-            hooks = query.all()
-            
-            # Score hooks by relevance
-            scored_hooks = []
-            for hook in hooks:
-                score = 0
-                
-                # Check tags
-                if hook.tags:
-                    for tag in hook.tags:
-                        if topic_lower in tag.lower():
-                            score += 2
-                
-                # Check use cases
-                if hook.use_cases:
-                    for use_case in hook.use_cases:
-                        if topic_lower in use_case.lower():
-                            score += 1
-                
-                # Check example tweet
-                if hook.example_tweet and topic_lower in hook.example_tweet.lower():
-                    score += 0.5
-                
-                if score > 0:
-                    scored_hooks.append((score, hook))
-            
-            # Sort by score and return top N
-            scored_hooks.sort(key=lambda x: x[0], reverse=True)
-            return [hook for _, hook in scored_hooks[:count]]
-        else:
-            # Return random high-performing hooks
+            # Score relevance in SQL against the raw JSON text; only the
+            # top `count` rows are hydrated and no tags/use_cases columns
+            # are deserialized per hook
+            topic_like = f'%{topic.lower()}%'
+            score = (
+                case((func.lower(func.json_extract(
+                    HookTemplate.tags, '$')).like(topic_like), 2), else_=0)
+                + case((func.lower(func.json_extract(
+                    HookTemplate.use_cases, '$')).like(topic_like), 1), else_=0)
+                + case((func.lower(
+                    HookTemplate.example_tweet).like(topic_like), 0.5), else_=0.0)
+            ).label('score')
+
+            stmt = select(HookTemplate).where(
+                HookTemplate.is_active == True,  # noqa: E712
+                score > 0
+            )
+            if pattern_type:
+                stmt = stmt.where(HookTemplate.pattern_type == pattern_type)
+            stmt = stmt.order_by(score.desc()).limit(count)
+            return self.session.execute(stmt).scalars().all()
+        elif pattern_type:
             return query.order_by(desc(HookTemplate.avg_engagement_rate)).limit(count).all()
+        else:
+            # Return high-performing hooks via the precompiled statement
+            return self.session.execute(_top_hooks_stmt(count)).scalars().all()
     
     def adapt_hook(self, hook_id: int, content: str, context: Dict[str, Any] = None) -> str:
         """Adapt a hook pattern to new content.
@@ -256,70 +415,64 @@ class HookManager:
         Returns:
             Adapted content with hook applied
         """
-        hook = self.session.query(HookTemplate).filter_by(id=hook_id).first()
+        hook = self.get_hook(hook_id)
         if not hook:
             raise ValueError(f"Hook {hook_id} not found")
         
         # Apply hook based on pattern type
-        if hook.pattern_type == HookPatternType.VALUE_GIVEAWAY:
-            return self._adapt_value_giveaway(hook, content, context)
-        elif hook.pattern_type == HookPatternType.SHOCK:
-            return self._adapt_shock_hook(hook, content, context)
-        elif hook.pattern_type == HookPatternType.RESULTS:
-            return self._adapt_results_hook(hook, content, context)
-        elif hook.pattern_type == HookPatternType.LIST:
-            return self._adapt_list_hook(hook, content, context)
-        else:
-            # Generic adaptation
-            return f"{hook.hook_text}\n\n{content}"
+        adapter_name = self._ADAPTERS.get(hook.pattern_type)
+        if adapter_name:
+            return getattr(self, adapter_name)(hook, content, context)
+        # Generic adaptation
+        return f"{hook.hook_text}\n\n{content}"
     
+    # Pattern type -> adapter method name; O(1) dispatch instead of an
+    # elif chain re-evaluated per call
+    _ADAPTERS = {
+        HookPatternType.VALUE_GIVEAWAY: '_adapt_value_giveaway',
+        HookPatternType.SHOCK: '_adapt_shock_hook',
+        HookPatternType.RESULTS: '_adapt_results_hook',
+        HookPatternType.LIST: '_adapt_list_hook',
+    }
+
     def _adapt_value_giveaway(self, hook: HookTemplate, content: str, context: Dict = None) -> str:
         """Adapt value giveaway pattern."""
         if context is None:
             context = {}
-        action_word = context.get('action', 'comment')
-        keyword = context.get('keyword', 'INFO')
-        value_item = context.get('value', 'the guide')
-        
-        adapted = f"{content}\n\n"
-        adapted += f"Want {value_item}?\n\n"
-        adapted += f"👉 RT + Like & {action_word.capitalize()} \"{keyword}\" and I'll DM it to you\n\n"
-        adapted += "(Must be following)"
-        
-        return adapted
+        return _VALUE_GIVEAWAY_TMPL.format_map({
+            'content': content,
+            'value': context.get('value', 'the guide'),
+            'action': context.get('action', 'comment').capitalize(),
+            'keyword': context.get('keyword', 'INFO'),
+        })
     
     def _adapt_shock_hook(self, hook: HookTemplate, content: str, context: Dict = None) -> str:
         """Adapt shock/intrigue pattern."""
         if context is None:
             context = {}
-        shock_phrases = [
-            "HOLY SH*T..🤯",
-            "This is INSANE...",
-            "I can't believe this...",
-            "Mind = BLOWN 🤯"
-        ]
-        
-        intro = context.get('intro', random.choice(shock_phrases))
+        intro = context.get('intro', random.choice(_SHOCK_INTROS))
         return f"{intro}\n\n{content}"
     
     def _adapt_results_hook(self, hook: HookTemplate, content: str, context: Dict = None) -> str:
         """Adapt results/numbers pattern."""
         if context is None:
             context = {}
-        result = context.get('result', '$10K monthly')
-        timeframe = context.get('timeframe', 'in 30 days')
-        
-        return f"How I achieved {result} {timeframe}:\n\n{content}"
+        return _RESULTS_TMPL.format_map({
+            'content': content,
+            'result': context.get('result', '$10K monthly'),
+            'timeframe': context.get('timeframe', 'in 30 days'),
+        })
     
     def _adapt_list_hook(self, hook: HookTemplate, content: str, context: Dict = None) -> str:
         """Adapt list pattern."""
         if context is None:
             context = {}
-        number = context.get('number', '10')
-        item_type = context.get('item_type', 'tips')
-        benefit = context.get('benefit', 'you need to know')
-        
-        return f"{number} {item_type} {benefit}:\n\n{content}"
+        return _LIST_TMPL.format_map({
+            'content': content,
+            'number': context.get('number', '10'),
+            'item_type': context.get('item_type', 'tips'),
+            'benefit': context.get('benefit', 'you need to know'),
+        })
     
     def analyze_tweet(self, content: str) -> Dict[str, Any]:
         """Analyze a tweet for hook patterns.
@@ -330,34 +483,31 @@ class HookManager:
         Returns:
             Analysis results including detected patterns and suggestions
         """
+        view = _TweetView.of(content)
+
         analysis = {
-            'detected_pattern': self._detect_pattern_type(content),
+            'detected_pattern': self._detect_pattern_type(view),
             'has_hook': False,
             'hook_strength': 0,  # 0-10 scale
             'suggestions': [],
             'improvements': []
         }
-        
+
         # Check if it starts with a hook
-        first_line = content.split('\n')[0] if '\n' in content else content[:50]
-        
-        # Check for attention-grabbing elements
-        attention_elements = {
-            'caps': bool(re.search(r'[A-Z]{3,}', first_line)),
-            'emoji': bool(re.search(r'[😀-🙏🌀-🗿🚀-🛿✂-➿]', first_line)),
-            'numbers': bool(re.search(r'\d+', first_line)),
-            'question': first_line.strip().endswith('?'),
-            'exclamation': '!' in first_line,
-        }
-        
+        first_line = view.first_line
+
+        # Check for attention-grabbing elements in one pass over first_line
+        attention_elements = dict.fromkeys(_ATTN_WEIGHTS, False)
+        for match in _ATTN_RE.finditer(first_line):
+            attention_elements[match.lastgroup] = True
+        attention_elements['question'] = first_line.strip().endswith('?')
+
         # Calculate hook strength
-        hook_strength = sum([
-            attention_elements['caps'] * 2,
-            attention_elements['emoji'] * 1,
-            attention_elements['numbers'] * 2,
-            attention_elements['question'] * 1.5,
-            attention_elements['exclamation'] * 1,
-        ])
+        hook_strength = sum(
+            weight
+            for element, weight in _ATTN_WEIGHTS.items()
+            if attention_elements[element]
+        )
         
         analysis['has_hook'] = hook_strength >= 3
         analysis['hook_strength'] = min(hook_strength, 10)
@@ -380,20 +530,23 @@ class HookManager:
         return analysis
     
     def track_usage(
-        self, 
-        hook_id: int, 
+        self,
+        hook_id: int,
         tweet_id: int,
         adapted_content: str = None,
-        notes: str = None
+        notes: str = None,
+        commit: bool = True
     ) -> HookUsage:
         """Track hook usage for a tweet.
-        
+
         Args:
             hook_id: ID of the hook used
             tweet_id: ID of the tweet
             adapted_content: The adapted content
             notes: Any adaptation notes
-            
+            commit: Commit immediately; batch callers pass False and
+                commit once at the end
+
         Returns:
             HookUsage record
         """
@@ -404,9 +557,10 @@ class HookManager:
             adaptation_notes=notes,
             used_at=datetime.utcnow()
         )
-        
+
         self.session.add(usage)
-        self.session.commit()
+        if commit:
+            self.session.commit()
         
         logger.info(f"Tracked hook {hook_id} usage for tweet {tweet_id}")
         return usage
@@ -424,10 +578,23 @@ class HookManager:
         if not hook:
             return {}
         
-        # Get usage statistics
-        usages = self.session.query(HookUsage).filter_by(hook_id=hook_id).all()
-        
-        if not usages:
+        # Aggregate usage statistics in SQL; no HookUsage rows are hydrated.
+        # Flush first since the session factory disables autoflush.
+        self.session.flush()
+        total_uses, avg_performance, best_performance, engagement_sum = (
+            self.session.execute(
+                select(
+                    func.count(HookUsage.id),
+                    func.avg(case((HookUsage.performance_score > 0,
+                                   HookUsage.performance_score))),
+                    func.max(HookUsage.performance_score),
+                    func.sum(case((HookUsage.engagement_rate > 0,
+                                   HookUsage.engagement_rate), else_=0.0)),
+                ).where(HookUsage.hook_id == hook_id)
+            ).one()
+        )
+
+        if not total_uses:
             return {
                 'hook_id': hook_id,
                 'total_uses': 0,
@@ -435,15 +602,13 @@ class HookManager:
                 'best_performance': 0,
                 'pattern_type': hook.pattern_type
             }
-        
-        performances = [u.performance_score for u in usages if u.performance_score]
-        
+
         return {
             'hook_id': hook_id,
-            'total_uses': len(usages),
-            'avg_performance': sum(performances) / len(performances) if performances else 0,
-            'best_performance': max(performances) if performances else 0,
-            'avg_engagement': sum([u.engagement_rate for u in usages if u.engagement_rate]) / len(usages),
+            'total_uses': total_uses,
+            'avg_performance': avg_performance or 0,
+            'best_performance': best_performance or 0,
+            'avg_engagement': (engagement_sum or 0) / total_uses,
             'pattern_type': hook.pattern_type,
             'tags': hook.tags
         }
@@ -466,30 +631,46 @@ class HookManager:
         Returns:
             List of hook templates
         """
+        if not (pattern_type or min_views or tags):
+            # Default listing shares the precompiled top-hooks statement
+            return self.session.execute(_top_hooks_stmt(limit)).scalars().all()
+
         query = self.session.query(HookTemplate).filter(
             HookTemplate.is_active == True
         )
-        
+
         if pattern_type:
             query = query.filter(HookTemplate.pattern_type == pattern_type)
-        
+
         if min_views:
             query = query.filter(HookTemplate.min_views >= min_views)
         
         if tags:
-            # Filter by tags (hooks that have any of the specified tags)
-            hooks = query.all()
-            filtered = []
-            for hook in hooks:
-                if hook.tags and any(tag in hook.tags for tag in tags):
-                    filtered.append(hook)
-            return filtered[:limit]
-        
+            # Match tags inside the JSON column in SQL so only matching rows
+            # are deserialized, instead of scanning every hook in Python
+            predicates = [
+                func.json_extract(HookTemplate.tags, '$').like(f'%"{tag}"%')
+                for tag in tags
+            ]
+            query = query.filter(or_(*predicates))
+
         return query.order_by(desc(HookTemplate.avg_engagement_rate)).limit(limit).all()
     
     def get_hook(self, hook_id: int) -> Optional[HookTemplate]:
         """Get a specific hook by ID."""
-        return self.session.query(HookTemplate).filter_by(id=hook_id).first()
+        hook = self._hook_cache.get(hook_id)
+        if hook is None:
+            hook = self.session.query(HookTemplate).filter_by(id=hook_id).first()
+            if hook is not None:
+                self._hook_cache[hook_id] = hook
+        return hook
+
+    def invalidate_hook_cache(self, hook_id: Optional[int] = None) -> None:
+        """Drop cached hook lookups, or a single entry if an ID is given."""
+        if hook_id is None:
+            self._hook_cache.clear()
+        else:
+            self._hook_cache.pop(hook_id, None)
     
     def update_hook_performance(self, usage_id: int, performance_data: Dict[str, Any]) -> None:
         """Update performance data for a hook usage.
@@ -498,7 +679,12 @@ class HookManager:
             usage_id: ID of the hook usage
             performance_data: Performance metrics (views, likes, etc.)
         """
-        usage = self.session.query(HookUsage).filter_by(id=usage_id).first()
+        usage = (
+            self.session.query(HookUsage)
+            .options(selectinload(HookUsage.hook_template))
+            .filter_by(id=usage_id)
+            .first()
+        )
         if not usage:
             return
         
@@ -517,25 +703,51 @@ class HookManager:
         # Calculate performance score (0-10)
         usage.performance_score = min(10, usage.engagement_rate * 2)
         
-        # Update hook template statistics
-        hook = usage.hook_template
-        all_usages = self.session.query(HookUsage).filter_by(hook_id=hook.id).all()
-        
-        if all_usages:
-            # Update average engagement rate
-            engagement_rates = [u.engagement_rate for u in all_usages if u.engagement_rate]
-            if engagement_rates:
-                hook.avg_engagement_rate = sum(engagement_rates) / len(engagement_rates)
-            
-            # Update success rate (considers > 5% engagement as success)
-            successful = len([u for u in all_usages if u.engagement_rate and u.engagement_rate > 5])
-            hook.success_rate = successful / len(all_usages)
-        
+        # Template-level aggregates are no longer rewritten per usage;
+        # refresh_template_stats folds them in periodically from the
+        # hook_template_stats view
         self.session.commit()
         logger.info(f"Updated performance for hook usage {usage_id}")
 
+    def refresh_template_stats(self) -> int:
+        """Fold usage aggregates from hook_template_stats into the templates.
+
+        One UPDATE..FROM over the aggregate view replaces a per-usage
+        rewrite of every template's derived columns; run it periodically
+        (or after a batch of performance updates) to amortize the cost.
+        Returns the number of templates refreshed.
+        """
+        result = self.session.execute(text("""
+            UPDATE hook_templates
+            SET avg_engagement_rate = COALESCE(s.avg_er, avg_engagement_rate),
+                success_rate = s.success_rate
+            FROM hook_template_stats AS s
+            WHERE hook_templates.id = s.hook_id
+        """))
+        self.session.commit()
+        return result.rowcount
+
+
+# Managers cached by session identity; entries disappear with their
+# session, so a removed thread-local session never pins a stale manager
+_managers: 'WeakKeyDictionary[Session, HookManager]' = WeakKeyDictionary()
+_managers_lock = threading.Lock()
+
 
 def get_hook_manager(session: Optional[Session] = None) -> HookManager:
-    """Get hook manager instance with proper session handling."""
-    # Always create a new instance to ensure fresh database session
-    return HookManager(session)
\ No newline at end of file
+    """Get the hook manager bound to the given session, reused per session.
+
+    With no argument the manager is keyed to the calling thread's
+    scoped session, so each thread reuses one manager (and its hook
+    cache) rather than every caller sharing whatever session the first
+    caller happened to hold. An explicit session gets its own cached
+    manager the same way.
+    """
+    if session is None:
+        session = ScopedSession()
+    with _managers_lock:
+        manager = _managers.get(session)
+        if manager is None:
+            manager = HookManager(session)
+            _managers[session] = manager
+        return manager
\ No newline at end of file
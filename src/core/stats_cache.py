@@ -0,0 +1,148 @@
+"""Process-local write-through counter for daily statistics.
+
+Callers record counter increments in memory via enqueue(); a background
+thread coalesces a second's worth of updates per day and applies them
+with one atomic ``INSERT .. ON CONFLICT DO UPDATE`` per day, so the hot
+schedule/post paths never pay a SELECT-then-UPDATE round-trip on the
+stats row. flush() drains the pending counters synchronously for
+callers (tests, shutdown) that need the database to reflect every
+recorded increment.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.models import DailyStats, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _build_daily_stats_upsert():
+    """Build the atomic counter-increment UPSERT for one day's stats.
+
+    Constructed once at import with bind parameters; callers execute it
+    with {'stat_date': ..., 'posted': ..., 'scheduled': ..., 'failed': ...}
+    so the statement object (and its compiled SQL, via the compilation
+    cache) is reused on every stats write instead of rebuilt per call.
+    """
+    stmt = sqlite_insert(DailyStats).values(
+        stat_date=bindparam('stat_date'),
+        tweets_posted=bindparam('posted'),
+        tweets_scheduled=bindparam('scheduled'),
+        tweets_failed=bindparam('failed'),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=['stat_date'],
+        set_={
+            'tweets_posted': DailyStats.tweets_posted + stmt.excluded.tweets_posted,
+            'tweets_scheduled': DailyStats.tweets_scheduled + stmt.excluded.tweets_scheduled,
+            'tweets_failed': DailyStats.tweets_failed + stmt.excluded.tweets_failed,
+        },
+    )
+
+
+DAILY_STATS_UPSERT = _build_daily_stats_upsert()
+
+
+# Pending increments live only in _pending ({stat_date: [posted,
+# scheduled, failed]}) guarded by _pending_lock. _flush_lock serializes
+# the take-and-write step itself, so a flush() that arrives while the
+# worker is mid-write blocks until that batch is committed rather than
+# seeing an empty _pending and returning early. _dirty wakes the worker
+# when new increments arrive.
+_pending: Dict[date, List[int]] = {}
+_pending_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_dirty = threading.Event()
+_FLUSH_INTERVAL = 1.0
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def _take_pending() -> Dict[date, List[int]]:
+    """Atomically swap out and return the pending per-day batch."""
+    with _pending_lock:
+        batch = dict(_pending)
+        _pending.clear()
+    return batch
+
+
+def _flush_batch(batch: Dict[date, List[int]]) -> None:
+    """Apply one coalesced UPSERT per day in a single transaction."""
+    try:
+        db = SessionLocal()
+        try:
+            for stat_date, (posted, scheduled, failed) in batch.items():
+                db.execute(DAILY_STATS_UPSERT, {
+                    'stat_date': stat_date, 'posted': posted,
+                    'scheduled': scheduled, 'failed': failed,
+                })
+            db.commit()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Failed to flush daily stats: {e}")
+
+
+def _drain_and_write() -> None:
+    """Take the pending batch and commit it, as one serialized step.
+
+    Holding _flush_lock across the swap and the write means no caller
+    can observe the window where a batch has left _pending but is not
+    yet committed.
+    """
+    with _flush_lock:
+        batch = _take_pending()
+        if batch:
+            _flush_batch(batch)
+
+
+def _worker() -> None:
+    while True:
+        _dirty.wait()
+        # Give concurrent updates a moment to accumulate, then flush.
+        # Clear before taking so increments recorded after the swap
+        # re-arm the event for the next round
+        time.sleep(_FLUSH_INTERVAL)
+        _dirty.clear()
+        _drain_and_write()
+
+
+def enqueue(stat_date: date, posted: int = 0, scheduled: int = 0,
+            failed: int = 0) -> None:
+    """Record counter increments in memory; the worker persists them."""
+    global _worker_started
+    if not _worker_started:
+        with _worker_lock:
+            if not _worker_started:
+                threading.Thread(target=_worker, daemon=True,
+                                 name='daily-stats-writer').start()
+                _worker_started = True
+    with _pending_lock:
+        counts = _pending.setdefault(stat_date, [0, 0, 0])
+        counts[0] += posted
+        counts[1] += scheduled
+        counts[2] += failed
+    _dirty.set()
+
+
+@atexit.register
+def flush() -> None:
+    """Persist every increment recorded so far.
+
+    Registered at exit so increments recorded just before shutdown are
+    not lost: counters sit in _pending until a flush takes them, and
+    the take-and-write runs under _flush_lock, so this call waits out
+    any batch the worker has already taken before draining the rest.
+    Also callable directly when a reader needs the database to reflect
+    every increment recorded so far (e.g. before asserting on a
+    DailyStats row in tests).
+    """
+    _drain_and_write()
@@ -1,66 +1,170 @@
 """Tweet management service for creating, scheduling, and posting tweets."""
 
 import logging
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from datetime import date, datetime, timezone
+from typing import Iterator, Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from src.models import (
-    get_db, Tweet, TweetStatus, ContentType, Media, MediaType, MediaSource,
-    DailyStats
+    SessionLocal, Tweet, TweetStatus, ContentType, Media, MediaType,
+    MediaSource
 )
-from src.api.twitter import twitter_api
-from src.api.openai_client import openai_client
+from src.core import stats_cache
 from src.core.config import settings
 
+# The Twitter client (and the Tweepy stack behind it) is imported lazily in
+# post_tweet/attach_media so read-only CLI commands skip its cold-start cost
+
 
 logger = logging.getLogger(__name__)
 
 
+# Extension -> media type lookup for attach_media; one hash probe instead
+# of chained list membership tests
+_EXT_TO_TYPE = {
+    '.jpg': MediaType.IMAGE,
+    '.jpeg': MediaType.IMAGE,
+    '.png': MediaType.IMAGE,
+    '.gif': MediaType.IMAGE,
+    '.mp4': MediaType.VIDEO,
+    '.mov': MediaType.VIDEO,
+    '.avi': MediaType.VIDEO,
+}
+
+
+@dataclass
+class TweetQueueItem:
+    """One formatted row of the tweet queue.
+
+    Slotted instances are roughly half the size of the 16-key dicts they
+    replace, which matters when CLI listings span thousands of tweets.
+    __slots__ is declared manually for Python 3.9 compatibility.
+    """
+
+    __slots__ = (
+        'id', 'content', 'full_content', 'status', 'content_type',
+        'scheduled_time', 'posted_time', 'character_count', 'ai_generated',
+        'has_media', 'media_count', 'twitter_id', 'twitter_url',
+        'error_message', 'retry_count', 'created_at',
+    )
+
+    id: int
+    content: str
+    full_content: str
+    status: str
+    content_type: str
+    scheduled_time: Optional[str]
+    posted_time: Optional[str]
+    character_count: int
+    ai_generated: bool
+    has_media: bool
+    media_count: int
+    twitter_id: Optional[str]
+    twitter_url: Optional[str]
+    error_message: Optional[str]
+    retry_count: int
+    created_at: str
+
+
+# Coarse clock: one datetime.now per 100 ms window, shared across the hot
+# paths, so tight polling loops do not pay a clock read per call
+_NOW_CACHE_TTL = 0.1
+_now_cache: tuple = (0.0, None)
+
+
+def _now_utc() -> datetime:
+    """Current UTC time, cached for up to 100 ms."""
+    global _now_cache
+    deadline, cached = _now_cache
+    mono = time.monotonic()
+    if cached is None or mono >= deadline:
+        cached = datetime.now(timezone.utc)
+        _now_cache = (mono + _NOW_CACHE_TTL, cached)
+    return cached
+
+
+def _validate_content(content: str) -> str:
+    """Strip and length-check tweet content, returning the cleaned string.
+
+    One strip and one len per tweet; the length is measured after
+    stripping so whitespace padding cannot sneak past the 280 limit.
+    """
+    stripped = content.strip()
+    length = len(stripped)
+    if not length:
+        raise ValueError("Tweet content cannot be empty")
+    if length > 280:
+        raise ValueError(f"Tweet too long: {length} characters (max 280)")
+    return stripped
+
+
+def _transactional(fn):
+    """Run a mutating method inside one session scope.
+
+    The wrapped method receives the session as its second argument; the
+    session commits on success (rolling back on error via _session) and
+    any exception is logged and reported as False, matching the boolean
+    contract of the mutation methods.
+    """
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            with self._session() as db:
+                return fn(self, db, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"{fn.__name__} failed: {e}")
+            return False
+    return wrapper
+
+
 class TweetManager:
-    """Manages tweet lifecycle from creation to posting."""
-    
-    def __init__(self):
-        self.db: Optional[Session] = None
-    
-    def _get_db(self) -> Session:
-        """Get database session."""
-        if not self.db:
-            self.db = next(get_db())
-        return self.db
-    
-    def _close_db(self) -> None:
-        """Close database session."""
-        if self.db:
-            self.db.close()
-            self.db = None
-    
+    """Manages tweet lifecycle from creation to posting.
+
+    The manager holds no session state; each public method runs inside
+    its own `_session()` scope, so instances are safe to share across
+    threads and sessions draw connections from the engine pool.
+    """
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Yield a session that commits on success and rolls back on error."""
+        db = SessionLocal()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     def create_tweet(self, content: str, content_type: ContentType = ContentType.PERSONAL,
                     scheduled_time: Optional[datetime] = None, ai_generated: bool = False,
                     generation_prompt: Optional[str] = None, generation_model: Optional[str] = None,
                     generation_cost: float = 0.0) -> Tweet:
         """Create a new tweet in the database."""
         try:
-            db = self._get_db()
-            
             # Validate content
-            if not content.strip():
-                raise ValueError("Tweet content cannot be empty")
-            
-            if len(content) > 280:
-                raise ValueError(f"Tweet too long: {len(content)} characters (max 280)")
-            
+            content = _validate_content(content)
+
             # Determine initial status
             if scheduled_time:
                 status = TweetStatus.SCHEDULED
             else:
                 status = TweetStatus.DRAFT
-            
+
             # Create tweet
             tweet = Tweet(
-                content=content.strip(),
+                content=content,
                 content_type=content_type,
                 scheduled_time=scheduled_time,
                 status=status,
@@ -69,404 +173,726 @@ class TweetManager:
                 generation_model=generation_model,
                 generation_cost=generation_cost
             )
-            
-            db.add(tweet)
-            db.commit()
-            db.refresh(tweet)
-            
+
+            with self._session() as db:
+                db.add(tweet)
+                db.flush()
+                db.refresh(tweet)
+                # Detach with attributes loaded so the final commit does
+                # not expire the instance we hand back
+                db.expunge(tweet)
+
             logger.info(f"Created tweet {tweet.id}: {content[:50]}...")
             return tweet
-            
+
         except Exception as e:
-            if self.db:
-                self.db.rollback()
             logger.error(f"Failed to create tweet: {e}")
             raise
-        finally:
-            self._close_db()
-    
+
+    def create_tweets(self, contents: List[str],
+                      content_type: ContentType = ContentType.PERSONAL,
+                      ai_generated: bool = False) -> List[Tweet]:
+        """Create multiple draft tweets in one transaction.
+
+        All contents are validated up front, then inserted with a single
+        flush and commit, so bulk imports pay one fsync instead of one
+        per tweet.
+        """
+        try:
+            tweets = [
+                Tweet(
+                    content=_validate_content(content),
+                    content_type=content_type,
+                    status=TweetStatus.DRAFT,
+                    ai_generated=ai_generated
+                )
+                for content in contents
+            ]
+
+            with self._session() as db:
+                db.add_all(tweets)
+                db.flush()
+                for tweet in tweets:
+                    db.refresh(tweet)
+                db.expunge_all()
+
+            logger.info(f"Created {len(tweets)} tweets in bulk")
+            return tweets
+
+        except Exception as e:
+            logger.error(f"Failed to create tweets in bulk: {e}")
+            raise
+
+    def bulk_create_tweets(self, items: List[Tuple[str, ContentType]]) -> List[int]:
+        """Insert (content, content_type) pairs as drafts in one statement.
+
+        Unlike ``create_tweets`` this skips ORM instance construction
+        entirely: a Core INSERT..RETURNING runs as a single executemany
+        and hands back the generated ids, so fixture-style loads pay one
+        round-trip and one commit regardless of row count.
+        """
+        rows = [
+            {
+                "content": _validate_content(content),
+                "content_type": content_type,
+                "status": TweetStatus.DRAFT,
+            }
+            for content, content_type in items
+        ]
+
+        try:
+            with self._session() as db:
+                ids = db.execute(
+                    insert(Tweet).returning(Tweet.id), rows
+                ).scalars().all()
+
+            logger.info(f"Bulk-created {len(ids)} tweets")
+            return list(ids)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk-create tweets: {e}")
+            raise
+
+    def schedule_tweets_bulk(self, schedule_map: Dict[int, datetime],
+                             now: Optional[datetime] = None) -> int:
+        """Schedule many tweets in one UPDATE; returns rows changed.
+
+        The per-id times go into a CASE expression so N schedules cost a
+        single statement and commit instead of one transaction each.
+        Posted tweets are skipped, matching ``schedule_tweet``.
+        """
+        if not schedule_map:
+            return 0
+
+        if now is None:
+            now = _now_utc()
+
+        normalized = {}
+        for tweet_id, scheduled_time in schedule_map.items():
+            if scheduled_time.tzinfo is None:
+                scheduled_time = scheduled_time.replace(tzinfo=timezone.utc)
+            if scheduled_time <= now:
+                raise ValueError("Scheduled time must be in the future")
+            normalized[tweet_id] = scheduled_time
+
+        try:
+            with self._session() as db:
+                result = db.execute(
+                    update(Tweet)
+                    .where(Tweet.id.in_(normalized))
+                    .where(Tweet.status != TweetStatus.POSTED)
+                    .values(
+                        status=TweetStatus.SCHEDULED.value,
+                        scheduled_time=case(normalized, value=Tweet.id),
+                    )
+                )
+
+            logger.info(f"Bulk-scheduled {result.rowcount} tweets")
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Failed to bulk-schedule tweets: {e}")
+            raise
+
+    def approve_tweets_bulk(self, tweet_ids: List[int]) -> int:
+        """Approve many tweets in one UPDATE; returns rows changed."""
+        if not tweet_ids:
+            return 0
+
+        try:
+            with self._session() as db:
+                result = db.execute(
+                    update(Tweet)
+                    .where(Tweet.id.in_(tweet_ids))
+                    .where(Tweet.status != TweetStatus.POSTED)
+                    .values(status=TweetStatus.APPROVED.value)
+                )
+
+            logger.info(f"Bulk-approved {result.rowcount} tweets")
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Failed to bulk-approve tweets: {e}")
+            raise
+
+    def get_queue_counts(self) -> Dict[TweetStatus, int]:
+        """Per-status tweet counts from one GROUP BY query.
+
+        Callers that only need sizes (dashboards, assertions) get every
+        status in a single round-trip instead of one filtered queue
+        fetch per status.
+        """
+        try:
+            with self._session() as db:
+                rows = db.execute(
+                    select(Tweet.status, func.count()).group_by(Tweet.status)
+                ).all()
+            return {TweetStatus(status): count for status, count in rows}
+        except Exception as e:
+            logger.error(f"Failed to get queue counts: {e}")
+            return {}
+
+    def delete_tweets(self, tweet_ids: List[int]) -> int:
+        """Delete many tweets in one statement; returns rows removed.
+
+        Bypasses per-tweet status checks — callers own the decision —
+        so cleanup of N rows is one DELETE..IN instead of N sessions.
+        """
+        if not tweet_ids:
+            return 0
+
+        try:
+            with self._session() as db:
+                result = db.execute(
+                    delete(Tweet).where(Tweet.id.in_(tweet_ids))
+                )
+
+            logger.info(f"Deleted {result.rowcount} tweets in bulk")
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Failed to bulk-delete tweets: {e}")
+            raise
+
     def get_tweet(self, tweet_id: int) -> Optional[Tweet]:
         """Get a tweet by ID."""
         try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            if tweet:
-                # Eagerly load relationships to avoid detached instance issues
-                # This loads media_items while the session is still active
-                _ = list(tweet.media_items)  # Force loading
-                db.expunge(tweet)  # Remove from session to avoid issues
-            return tweet
+            with self._session() as db:
+                # Relationships are selectin-loaded by default, so the
+                # detached instance stays usable after the session closes
+                tweet = db.get(Tweet, tweet_id)
+                if tweet:
+                    db.expunge_all()  # Remove from session to avoid issues
+                return tweet
         except Exception as e:
             logger.error(f"Failed to get tweet {tweet_id}: {e}")
             return None
-        finally:
-            self._close_db()
-    
-    def get_tweets_by_status(self, status: TweetStatus, limit: int = 50) -> List[Tweet]:
-        """Get tweets by status."""
+
+    def get_tweets_by_status(self, status: TweetStatus, limit: int = 50) -> List[Row]:
+        """Get tweets by status.
+
+        Returns lightweight rows of (id, content, scheduled_time, status)
+        rather than full ORM instances; listings only read those columns
+        and skipping hydration keeps per-row cost low.
+        """
         try:
-            db = self._get_db()
-            tweets = db.query(Tweet).filter_by(status=status).limit(limit).all()
-            return tweets
+            with self._session() as db:
+                return db.execute(
+                    select(Tweet.id, Tweet.content, Tweet.scheduled_time, Tweet.status)
+                    .where(Tweet.status == status)
+                    .limit(limit)
+                ).all()
         except Exception as e:
             logger.error(f"Failed to get tweets by status {status}: {e}")
             return []
-        finally:
-            self._close_db()
-    
-    def get_scheduled_tweets(self, due_now: bool = False) -> List[Tweet]:
-        """Get scheduled tweets, optionally only those due now."""
+
+    def get_tweets_by_content_type(self, content_type: ContentType,
+                                   limit: int = 50) -> List[Row]:
+        """Get tweets by content type.
+
+        The filter runs in SQL against the (content_type, status,
+        scheduled_time) index rather than fetching rows and filtering in
+        Python; same lightweight row projection as get_tweets_by_status.
+        """
         try:
-            db = self._get_db()
-            query = db.query(Tweet).filter_by(status=TweetStatus.SCHEDULED)
-            
-            if due_now:
-                now = datetime.now(timezone.utc)
-                query = query.filter(Tweet.scheduled_time <= now)
-            
-            tweets = query.order_by(Tweet.scheduled_time).all()
-            return tweets
+            with self._session() as db:
+                return db.execute(
+                    select(Tweet.id, Tweet.content, Tweet.content_type,
+                           Tweet.scheduled_time, Tweet.status)
+                    .where(Tweet.content_type == content_type)
+                    .limit(limit)
+                ).all()
         except Exception as e:
-            logger.error(f"Failed to get scheduled tweets: {e}")
+            logger.error(f"Failed to get tweets by content type {content_type}: {e}")
             return []
-        finally:
-            self._close_db()
-    
-    def update_tweet_content(self, tweet_id: int, content: str) -> bool:
-        """Update tweet content."""
+
+    def get_scheduled_tweets(self, due_now: bool = False,
+                             now: Optional[datetime] = None) -> List[Tweet]:
+        """Get scheduled tweets, optionally only those due now.
+
+        Polling callers can compute `now` once per tick and pass it in
+        instead of taking a fresh clock reading per call.
+        """
         try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED:
-                logger.error(f"Cannot update posted tweet {tweet_id}")
-                return False
-            
-            if len(content) > 280:
-                raise ValueError(f"Tweet too long: {len(content)} characters (max 280)")
-            
-            tweet.content = content.strip()
-            db.commit()
-            
-            logger.info(f"Updated tweet {tweet_id} content")
-            return True
-            
+            with self._session() as db:
+                query = db.query(Tweet).filter_by(status=TweetStatus.SCHEDULED)
+
+                if due_now:
+                    if now is None:
+                        now = _now_utc()
+                    query = query.filter(Tweet.scheduled_time <= now)
+
+                tweets = query.order_by(Tweet.scheduled_time).all()
+                db.expunge_all()
+                return tweets
         except Exception as e:
-            if self.db:
-                self.db.rollback()
-            logger.error(f"Failed to update tweet {tweet_id}: {e}")
+            logger.error(f"Failed to get scheduled tweets: {e}")
+            return []
+
+    @_transactional
+    def update_tweet_content(self, db: Session, tweet_id: int, content: str) -> bool:
+        """Update tweet content."""
+        tweet = db.get(Tweet, tweet_id)
+
+        if not tweet:
+            logger.error(f"Tweet {tweet_id} not found")
             return False
-        finally:
-            self._close_db()
-    
-    def schedule_tweet(self, tweet_id: int, scheduled_time: datetime) -> bool:
+
+        if tweet.status == TweetStatus.POSTED:
+            logger.error(f"Cannot update posted tweet {tweet_id}")
+            return False
+
+        tweet.content = _validate_content(content)
+
+        logger.info(f"Updated tweet {tweet_id} content")
+        return True
+
+    @_transactional
+    def schedule_tweet(self, db: Session, tweet_id: int, scheduled_time: datetime,
+                       now: Optional[datetime] = None) -> bool:
         """Schedule a tweet for posting."""
-        try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED:
-                logger.error(f"Cannot reschedule posted tweet {tweet_id}")
-                return False
-            
-            # Ensure scheduled time is in the future
-            # Handle timezone-aware vs naive datetime comparison
-            now = datetime.now(timezone.utc)
-            if scheduled_time.tzinfo is None:
-                # If scheduled_time is naive, assume it's in UTC
-                scheduled_time = scheduled_time.replace(tzinfo=timezone.utc)
-            
-            if scheduled_time <= now:
-                raise ValueError("Scheduled time must be in the future")
-            
-            tweet.scheduled_time = scheduled_time
-            tweet.status = TweetStatus.SCHEDULED
-            db.commit()
-            
-            logger.info(f"Scheduled tweet {tweet_id} for {scheduled_time}")
-            return True
-            
-        except Exception as e:
-            if self.db:
-                self.db.rollback()
-            logger.error(f"Failed to schedule tweet {tweet_id}: {e}")
+        tweet = db.get(Tweet, tweet_id)
+
+        if not tweet:
+            logger.error(f"Tweet {tweet_id} not found")
             return False
-        finally:
-            self._close_db()
-    
-    def approve_tweet(self, tweet_id: int) -> bool:
+
+        if tweet.status == TweetStatus.POSTED:
+            logger.error(f"Cannot reschedule posted tweet {tweet_id}")
+            return False
+
+        # Ensure scheduled time is in the future
+        # Handle timezone-aware vs naive datetime comparison
+        if now is None:
+            now = _now_utc()
+        if scheduled_time.tzinfo is None:
+            # If scheduled_time is naive, assume it's in UTC
+            scheduled_time = scheduled_time.replace(tzinfo=timezone.utc)
+
+        if scheduled_time <= now:
+            raise ValueError("Scheduled time must be in the future")
+
+        tweet.scheduled_time = scheduled_time
+        tweet.status = TweetStatus.SCHEDULED
+
+        logger.info(f"Scheduled tweet {tweet_id} for {scheduled_time}")
+        return True
+
+    @_transactional
+    def approve_tweet(self, db: Session, tweet_id: int) -> bool:
         """Approve a tweet for posting."""
-        try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED:
-                logger.warning(f"Tweet {tweet_id} is already posted")
-                return True
-            
-            tweet.status = TweetStatus.APPROVED
-            db.commit()
-            
-            logger.info(f"Approved tweet {tweet_id}")
-            return True
-            
-        except Exception as e:
-            if self.db:
-                self.db.rollback()
-            logger.error(f"Failed to approve tweet {tweet_id}: {e}")
+        tweet = db.get(Tweet, tweet_id)
+
+        if not tweet:
+            logger.error(f"Tweet {tweet_id} not found")
             return False
-        finally:
-            self._close_db()
-    
+
+        if tweet.status == TweetStatus.POSTED:
+            logger.warning(f"Tweet {tweet_id} is already posted")
+            return True
+
+        tweet.status = TweetStatus.APPROVED
+
+        logger.info(f"Approved tweet {tweet_id}")
+        return True
+
     def post_tweet(self, tweet_id: int, force: bool = False) -> bool:
         """Post a tweet to Twitter/X."""
         try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED:
-                logger.warning(f"Tweet {tweet_id} is already posted")
-                return True
-            
-            # Check if tweet can be posted
-            if not force and not tweet.can_be_posted:
-                logger.error(f"Tweet {tweet_id} cannot be posted (status: {tweet.status})")
-                return False
-            
-            # Update status to posting
-            tweet.status = TweetStatus.POSTING
-            db.commit()
-            
-            # Prepare media IDs if any
-            media_ids = []
-            for media in tweet.media_items:
-                if media.twitter_media_id:
-                    media_ids.append(media.twitter_media_id)
-            
-            # Post to Twitter
-            result = twitter_api.post_tweet(
-                content=tweet.content,
-                media_ids=media_ids if media_ids else None
-            )
-            
-            if result:
-                # Update tweet with Twitter response
-                tweet.status = TweetStatus.POSTED
-                tweet.posted_time = datetime.now(timezone.utc)
-                tweet.twitter_id = result['id']
-                tweet.twitter_url = result['url']
-                tweet.error_message = None
-                tweet.retry_count = 0
-                
-                db.commit()
-                
-                # Update daily stats
-                self._update_daily_stats(posted=1)
-                
-                logger.info(f"Successfully posted tweet {tweet_id} to Twitter: {result['id']}")
-                return True
-            else:
-                # Post failed
-                tweet.status = TweetStatus.FAILED
-                tweet.error_message = "Failed to post to Twitter"
-                tweet.retry_count += 1
-                
-                db.commit()
-                
-                # Update daily stats
-                self._update_daily_stats(failed=1)
-                
-                logger.error(f"Failed to post tweet {tweet_id} to Twitter")
-                return False
-                
-        except Exception as e:
-            if self.db:
-                self.db.rollback()
-                # Update tweet status to failed
-                try:
+            with self._session() as db:
+                tweet = db.get(Tweet, tweet_id)
+
+                if not tweet:
+                    logger.error(f"Tweet {tweet_id} not found")
+                    return False
+
+                if tweet.status == TweetStatus.POSTED:
+                    logger.warning(f"Tweet {tweet_id} is already posted")
+                    return True
+
+                # Check if tweet can be posted
+                if not force and not tweet.can_be_posted:
+                    logger.error(f"Tweet {tweet_id} cannot be posted (status: {tweet.status})")
+                    return False
+
+                # Mark as posting for logging/ORM state; not committed
+                # separately since nothing else reads the transient state
+                tweet.status = TweetStatus.POSTING
+
+                # Prepare media IDs if any
+                media_ids = []
+                for media in tweet.media_items:
+                    if media.twitter_media_id:
+                        media_ids.append(media.twitter_media_id)
+
+                # Post to Twitter
+                from src.api.twitter import twitter_api
+                result = twitter_api.post_tweet(
+                    content=tweet.content,
+                    media_ids=media_ids if media_ids else None
+                )
+
+                if result:
+                    # Update tweet with Twitter response
+                    tweet.status = TweetStatus.POSTED
+                    tweet.posted_time = _now_utc()
+                    tweet.twitter_id = result['id']
+                    tweet.twitter_url = result['url']
+                    tweet.error_message = None
+                    tweet.retry_count = 0
+
+                    # Stats ride in the same transaction; one commit (and
+                    # one WAL fsync) per posted tweet, on session exit
+                    self._update_daily_stats(posted=1, db=db)
+
+                    logger.info(f"Successfully posted tweet {tweet_id} to Twitter: {result['id']}")
+                    return True
+                else:
+                    # Post failed
                     tweet.status = TweetStatus.FAILED
-                    tweet.error_message = str(e)
+                    tweet.error_message = "Failed to post to Twitter"
                     tweet.retry_count += 1
-                    self.db.commit()
-                except Exception:
-                    pass
-            
+
+                    self._update_daily_stats(failed=1, db=db)
+
+                    logger.error(f"Failed to post tweet {tweet_id} to Twitter")
+                    return False
+
+        except Exception as e:
+            # Best effort: record the failure on the tweet in a fresh session
+            try:
+                with self._session() as db:
+                    tweet = db.get(Tweet, tweet_id)
+                    if tweet:
+                        tweet.status = TweetStatus.FAILED
+                        tweet.error_message = str(e)
+                        tweet.retry_count += 1
+            except Exception:
+                pass
+
             logger.error(f"Error posting tweet {tweet_id}: {e}")
             return False
-        finally:
-            self._close_db()
-    
-    def delete_tweet(self, tweet_id: int, force: bool = False) -> bool:
-        """Delete a tweet from the database."""
+
+    def post_tweets(self, tweet_ids: List[int], concurrency: int = 4) -> Dict[int, bool]:
+        """Post several tweets, running the Twitter API calls concurrently.
+
+        The API calls are I/O bound, so a small thread pool overlaps
+        them; all status updates and the stats increment then commit in
+        one transaction. Returns a per-tweet success map.
+        """
+        results: Dict[int, bool] = {}
         try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED and not force:
-                logger.error(f"Cannot delete posted tweet {tweet_id} without force flag")
-                return False
-            
-            db.delete(tweet)
-            db.commit()
-            
-            logger.info(f"Deleted tweet {tweet_id}")
-            return True
-            
+            from src.api.twitter import twitter_api
+
+            with self._session() as db:
+                tweets = (
+                    db.query(Tweet)
+                    .filter(Tweet.id.in_(tweet_ids))
+                    .all()
+                )
+                by_id = {tweet.id: tweet for tweet in tweets}
+
+                postable = []
+                for tweet_id in tweet_ids:
+                    tweet = by_id.get(tweet_id)
+                    if tweet is None:
+                        logger.error(f"Tweet {tweet_id} not found")
+                        results[tweet_id] = False
+                    elif tweet.status == TweetStatus.POSTED:
+                        logger.warning(f"Tweet {tweet_id} is already posted")
+                        results[tweet_id] = True
+                    elif not tweet.can_be_posted:
+                        logger.error(f"Tweet {tweet_id} cannot be posted (status: {tweet.status})")
+                        results[tweet_id] = False
+                    else:
+                        postable.append(tweet)
+
+                if not postable:
+                    return results
+
+                def _post(tweet: Tweet):
+                    media_ids = [
+                        media.twitter_media_id
+                        for media in tweet.media_items
+                        if media.twitter_media_id
+                    ]
+                    try:
+                        return twitter_api.post_tweet(
+                            content=tweet.content,
+                            media_ids=media_ids if media_ids else None
+                        )
+                    except Exception as e:
+                        logger.error(f"Error posting tweet {tweet.id}: {e}")
+                        return None
+
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    api_results = list(executor.map(_post, postable))
+
+                posted = failed = 0
+                now = _now_utc()
+                for tweet, result in zip(postable, api_results):
+                    if result:
+                        tweet.status = TweetStatus.POSTED
+                        tweet.posted_time = now
+                        tweet.twitter_id = result['id']
+                        tweet.twitter_url = result['url']
+                        tweet.error_message = None
+                        tweet.retry_count = 0
+                        posted += 1
+                        results[tweet.id] = True
+                    else:
+                        tweet.status = TweetStatus.FAILED
+                        tweet.error_message = "Failed to post to Twitter"
+                        tweet.retry_count += 1
+                        failed += 1
+                        results[tweet.id] = False
+
+                self._update_daily_stats(posted=posted, failed=failed, db=db)
+
+            logger.info(f"Bulk posted {posted} tweets ({failed} failed)")
+            return results
+
         except Exception as e:
-            if self.db:
-                self.db.rollback()
-            logger.error(f"Failed to delete tweet {tweet_id}: {e}")
+            logger.error(f"Failed to post tweets in bulk: {e}")
+            for tweet_id in tweet_ids:
+                results.setdefault(tweet_id, False)
+            return results
+
+    @_transactional
+    def delete_tweet(self, db: Session, tweet_id: int, force: bool = False) -> bool:
+        """Delete a tweet from the database."""
+        tweet = db.get(Tweet, tweet_id)
+
+        if not tweet:
+            logger.error(f"Tweet {tweet_id} not found")
             return False
-        finally:
-            self._close_db()
-    
-    def attach_media(self, tweet_id: int, media_path: Path, alt_text: Optional[str] = None) -> bool:
+
+        if tweet.status == TweetStatus.POSTED and not force:
+            logger.error(f"Cannot delete posted tweet {tweet_id} without force flag")
+            return False
+
+        db.delete(tweet)
+
+        logger.info(f"Deleted tweet {tweet_id}")
+        return True
+
+    @_transactional
+    def attach_media(self, db: Session, tweet_id: int, media_path: Path,
+                     alt_text: Optional[str] = None) -> bool:
         """Attach media to a tweet and upload to Twitter."""
+        tweet = db.get(Tweet, tweet_id)
+
+        if not tweet:
+            logger.error(f"Tweet {tweet_id} not found")
+            return False
+
+        if tweet.status == TweetStatus.POSTED:
+            logger.error(f"Cannot attach media to posted tweet {tweet_id}")
+            return False
+
+        # One stat() covers both the existence check and the size
         try:
-            db = self._get_db()
-            tweet = db.query(Tweet).filter_by(id=tweet_id).first()
-            
-            if not tweet:
-                logger.error(f"Tweet {tweet_id} not found")
-                return False
-            
-            if tweet.status == TweetStatus.POSTED:
-                logger.error(f"Cannot attach media to posted tweet {tweet_id}")
-                return False
-            
-            if not media_path.exists():
-                logger.error(f"Media file not found: {media_path}")
-                return False
-            
-            # Determine media type
-            suffix = media_path.suffix.lower()
-            if suffix in ['.jpg', '.jpeg', '.png', '.gif']:
-                media_type = MediaType.IMAGE
-            elif suffix in ['.mp4', '.mov', '.avi']:
-                media_type = MediaType.VIDEO
-            else:
-                logger.error(f"Unsupported media type: {suffix}")
-                return False
-            
-            # Upload to Twitter
-            twitter_media_id = twitter_api.upload_media(media_path, alt_text)
-            
-            if not twitter_media_id:
-                logger.error(f"Failed to upload media to Twitter: {media_path}")
-                return False
-            
-            # Create media record
-            media = Media(
-                filename=media_path.name,
-                file_path=str(media_path),
-                file_size=media_path.stat().st_size,
-                media_type=media_type,
-                media_source=MediaSource.UPLOADED,
-                twitter_media_id=twitter_media_id,
-                alt_text=alt_text,
-                tweet_id=tweet_id
-            )
-            
-            db.add(media)
-            db.commit()
-            
-            logger.info(f"Attached media {media_path.name} to tweet {tweet_id}")
+            file_size = media_path.stat().st_size
+        except FileNotFoundError:
+            logger.error(f"Media file not found: {media_path}")
+            return False
+
+        # Determine media type
+        suffix = media_path.suffix.lower()
+        media_type = _EXT_TO_TYPE.get(suffix)
+        if media_type is None:
+            logger.error(f"Unsupported media type: {suffix}")
+            return False
+
+        # Upload to Twitter
+        from src.api.twitter import twitter_api
+        twitter_media_id = twitter_api.upload_media(media_path, alt_text)
+
+        if not twitter_media_id:
+            logger.error(f"Failed to upload media to Twitter: {media_path}")
+            return False
+
+        # Create media record
+        media = Media(
+            filename=media_path.name,
+            file_path=str(media_path),
+            file_size=file_size,
+            media_type=media_type,
+            media_source=MediaSource.UPLOADED,
+            twitter_media_id=twitter_media_id,
+            alt_text=alt_text,
+            tweet_id=tweet_id
+        )
+
+        db.add(media)
+
+        logger.info(f"Attached media {media_path.name} to tweet {tweet_id}")
+        return True
+
+    def attach_media_many(self, tweet_id: int,
+                          paths: List[Tuple[Path, Optional[str]]],
+                          concurrency: int = 4) -> bool:
+        """Attach several media files to a tweet in one transaction.
+
+        The Twitter uploads run concurrently and all Media rows insert
+        with one bulk save and one commit, instead of a commit per file.
+
+        Args:
+            tweet_id: ID of the tweet
+            paths: (media_path, alt_text) pairs
+            concurrency: Upload workers
+        """
+        try:
+            from src.api.twitter import twitter_api
+
+            with self._session() as db:
+                tweet = db.get(Tweet, tweet_id)
+
+                if not tweet:
+                    logger.error(f"Tweet {tweet_id} not found")
+                    return False
+
+                if tweet.status == TweetStatus.POSTED:
+                    logger.error(f"Cannot attach media to posted tweet {tweet_id}")
+                    return False
+
+                # Validate every file before any upload starts
+                records = []
+                for media_path, alt_text in paths:
+                    try:
+                        file_size = media_path.stat().st_size
+                    except FileNotFoundError:
+                        logger.error(f"Media file not found: {media_path}")
+                        return False
+
+                    media_type = _EXT_TO_TYPE.get(media_path.suffix.lower())
+                    if media_type is None:
+                        logger.error(f"Unsupported media type: {media_path.suffix.lower()}")
+                        return False
+
+                    records.append((media_path, alt_text, file_size, media_type))
+
+                def _upload(record):
+                    media_path, alt_text = record[0], record[1]
+                    try:
+                        return twitter_api.upload_media(media_path, alt_text)
+                    except Exception as e:
+                        logger.error(f"Failed to upload media {media_path}: {e}")
+                        return None
+
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    twitter_media_ids = list(executor.map(_upload, records))
+
+                if not all(twitter_media_ids):
+                    logger.error(f"Failed to upload media to Twitter for tweet {tweet_id}")
+                    return False
+
+                media_objects = [
+                    Media(
+                        filename=media_path.name,
+                        file_path=str(media_path),
+                        file_size=file_size,
+                        media_type=media_type,
+                        media_source=MediaSource.UPLOADED,
+                        twitter_media_id=twitter_media_id,
+                        alt_text=alt_text,
+                        tweet_id=tweet_id
+                    )
+                    for (media_path, alt_text, file_size, media_type), twitter_media_id
+                    in zip(records, twitter_media_ids)
+                ]
+                db.bulk_save_objects(media_objects)
+
+            logger.info(f"Attached {len(media_objects)} media files to tweet {tweet_id}")
             return True
-            
+
         except Exception as e:
-            if self.db:
-                self.db.rollback()
             logger.error(f"Failed to attach media to tweet {tweet_id}: {e}")
             return False
-        finally:
-            self._close_db()
-    
-    def _update_daily_stats(self, posted: int = 0, scheduled: int = 0, failed: int = 0) -> None:
-        """Update daily statistics."""
+
+    def _update_daily_stats(self, posted: int = 0, scheduled: int = 0, failed: int = 0,
+                            db: Optional[Session] = None,
+                            stat_date: Optional[date] = None) -> None:
+        """Update daily statistics.
+
+        When a session is passed in, the upsert joins that transaction and
+        commits with it; otherwise the update is handed to the background
+        stats writer so callers never block on a stats commit. Batch
+        callers can pass stat_date to reuse one clock reading.
+        """
         try:
-            from datetime import date
-            
-            db = self._get_db()
-            today = date.today()
-            
-            # Get or create daily stats
-            daily_stats = db.query(DailyStats).filter_by(stat_date=today).first()
-            
-            if not daily_stats:
-                daily_stats = DailyStats(stat_date=today)
-                db.add(daily_stats)
-            
-            # Update counts
-            daily_stats.tweets_posted += posted
-            daily_stats.tweets_scheduled += scheduled
-            daily_stats.tweets_failed += failed
-            
-            db.commit()
-            
+            if stat_date is None:
+                stat_date = date.today()
+
+            if db is not None:
+                # One atomic UPSERT instead of SELECT-then-UPDATE; the
+                # conflict clause increments the counters in place
+                db.execute(stats_cache.DAILY_STATS_UPSERT, {
+                    'stat_date': stat_date, 'posted': posted,
+                    'scheduled': scheduled, 'failed': failed,
+                })
+            else:
+                stats_cache.enqueue(stat_date, posted, scheduled, failed)
+
         except Exception as e:
             logger.error(f"Failed to update daily stats: {e}")
-    
-    def get_tweet_queue(self, status_filter: Optional[TweetStatus] = None, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get tweet queue with formatting for display."""
+
+    def iter_tweet_queue(self, status_filter: Optional[TweetStatus] = None,
+                         limit: int = 50) -> Iterator[TweetQueueItem]:
+        """Stream formatted queue rows one at a time.
+
+        Rows are fetched in yield_per batches, so peak memory stays flat
+        for large windows and lazy consumers (pagers, JSON streams) see
+        the first row before the last is hydrated.
+        """
         try:
-            db = self._get_db()
-            
-            query = db.query(Tweet)
-            if status_filter:
-                query = query.filter_by(status=status_filter)
-            
-            tweets = query.order_by(Tweet.scheduled_time.asc().nullslast(), Tweet.created_at.desc()).limit(limit).all()
-            
-            queue = []
-            for tweet in tweets:
-                queue_item = {
-                    'id': tweet.id,
-                    'content': tweet.content[:50] + '...' if len(tweet.content) > 50 else tweet.content,
-                    'full_content': tweet.content,
-                    'status': tweet.status.value,
-                    'content_type': tweet.content_type.value,
-                    'scheduled_time': tweet.scheduled_time.isoformat() if tweet.scheduled_time else None,
-                    'posted_time': tweet.posted_time.isoformat() if tweet.posted_time else None,
-                    'character_count': len(tweet.content),
-                    'ai_generated': tweet.ai_generated,
-                    'has_media': len(tweet.media_items) > 0,
-                    'media_count': len(tweet.media_items),
-                    'twitter_id': tweet.twitter_id,
-                    'twitter_url': tweet.twitter_url,
-                    'error_message': tweet.error_message,
-                    'retry_count': tweet.retry_count,
-                    'created_at': tweet.created_at.isoformat()
-                }
-                queue.append(queue_item)
-            
-            return queue
-            
+            with self._session() as db:
+                # Correlated subquery so the media flag comes back in the same
+                # round-trip instead of one lazy load per tweet (N+1)
+                media_count_sq = (
+                    db.query(func.count(Media.id))
+                    .filter(Media.tweet_id == Tweet.id)
+                    .correlate(Tweet)
+                    .scalar_subquery()
+                )
+
+                query = db.query(Tweet, media_count_sq.label('media_count'))
+                if status_filter:
+                    query = query.filter(Tweet.status == status_filter)
+
+                rows = query.order_by(Tweet.scheduled_time.asc().nullslast(), Tweet.created_at.desc()).limit(limit).yield_per(100)
+
+                # Local bindings keep the per-row work to attribute reads
+                # and one slotted instance, no global/method lookups in the loop
+                iso = datetime.isoformat
+                for tweet, media_count in rows:
+                    content = tweet.content
+                    yield TweetQueueItem(
+                        id=tweet.id,
+                        content=content[:50] + '...' if len(content) > 50 else content,
+                        full_content=content,
+                        status=tweet.status,
+                        content_type=tweet.content_type,
+                        scheduled_time=iso(tweet.scheduled_time) if tweet.scheduled_time else None,
+                        posted_time=iso(tweet.posted_time) if tweet.posted_time else None,
+                        character_count=len(content),
+                        ai_generated=tweet.ai_generated,
+                        has_media=media_count > 0,
+                        media_count=media_count,
+                        twitter_id=tweet.twitter_id,
+                        twitter_url=tweet.twitter_url,
+                        error_message=tweet.error_message,
+                        retry_count=tweet.retry_count,
+                        created_at=iso(tweet.created_at)
+                    )
+
         except Exception as e:
             logger.error(f"Failed to get tweet queue: {e}")
-            return []
-        finally:
-            self._close_db()
+
+    def get_tweet_queue(self, status_filter: Optional[TweetStatus] = None, limit: int = 50) -> List[TweetQueueItem]:
+        """Get tweet queue with formatting for display."""
+        return list(self.iter_tweet_queue(status_filter, limit))
 
 
 # Global tweet manager instance
-tweet_manager = TweetManager()
\ No newline at end of file
+tweet_manager = TweetManager()
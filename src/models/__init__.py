@@ -1,6 +1,6 @@
 """Database models for X-Scheduler."""
 
-from src.models.base import Base, TimestampMixin, get_db, init_db
+from src.models.base import Base, TimestampMixin, SessionLocal, ScopedSession, get_db, init_db
 from src.models.tweet import Tweet, TweetStatus, ContentType
 from src.models.media import Media, MediaType, MediaSource
 from src.models.api_usage import APIUsage, APIBudget, APIProvider, APIEndpoint
@@ -12,6 +12,8 @@ __all__ = [
     # Base
     "Base",
     "TimestampMixin",
+    "SessionLocal",
+    "ScopedSession",
     "get_db",
     "init_db",
     
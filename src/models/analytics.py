@@ -6,11 +6,11 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, Integer, String, Float, Date, DateTime,
-    Boolean, JSON, Enum as SQLEnum, UniqueConstraint
+    Boolean, Enum as SQLEnum, UniqueConstraint, text
 )
 from sqlalchemy.sql import func
 
-from src.models.base import Base, TimestampMixin
+from src.models.base import Base, TimestampMixin, JSONValue
 
 
 class MetricType(str, Enum):
@@ -34,31 +34,31 @@ class DailyStats(Base, TimestampMixin):
     stat_date = Column(Date, nullable=False, unique=True, index=True)
     
     # Posting metrics
-    tweets_posted = Column(Integer, default=0)
-    tweets_scheduled = Column(Integer, default=0)
-    tweets_failed = Column(Integer, default=0)
+    tweets_posted = Column(Integer, nullable=False, server_default=text("0"))
+    tweets_scheduled = Column(Integer, nullable=False, server_default=text("0"))
+    tweets_failed = Column(Integer, nullable=False, server_default=text("0"))
     
     # Engagement metrics
-    total_likes = Column(Integer, default=0)
-    total_retweets = Column(Integer, default=0)
-    total_replies = Column(Integer, default=0)
-    total_impressions = Column(Integer, default=0)
+    total_likes = Column(Integer, nullable=False, server_default=text("0"))
+    total_retweets = Column(Integer, nullable=False, server_default=text("0"))
+    total_replies = Column(Integer, nullable=False, server_default=text("0"))
+    total_impressions = Column(Integer, nullable=False, server_default=text("0"))
     
     # Growth metrics
-    followers_count = Column(Integer, default=0)
-    followers_gained = Column(Integer, default=0)
-    followers_lost = Column(Integer, default=0)
+    followers_count = Column(Integer, nullable=False, server_default=text("0"))
+    followers_gained = Column(Integer, nullable=False, server_default=text("0"))
+    followers_lost = Column(Integer, nullable=False, server_default=text("0"))
     
     # API usage
-    api_calls_made = Column(Integer, default=0)
-    api_cost = Column(Float, default=0.0)
+    api_calls_made = Column(Integer, nullable=False, server_default=text("0"))
+    api_cost = Column(Float, nullable=False, server_default=text("0"))
     
     # Media usage
-    images_generated = Column(Integer, default=0)
-    videos_generated = Column(Integer, default=0)
+    images_generated = Column(Integer, nullable=False, server_default=text("0"))
+    videos_generated = Column(Integer, nullable=False, server_default=text("0"))
     
     # Additional metrics
-    extra_data = Column(JSON, nullable=True)
+    extra_data = Column(JSONValue, nullable=True)
     
     def __repr__(self) -> str:
         return f"<DailyStats(date={self.stat_date}, tweets={self.tweets_posted}, followers={self.followers_count})>"
@@ -76,6 +76,23 @@ class DailyStats(Base, TimestampMixin):
         """Get net follower change."""
         return self.followers_gained - self.followers_lost
 
+    @classmethod
+    def overall_engagement_rate(cls, db) -> float:
+        """Engagement rate across all days, aggregated in one SQL query.
+
+        Sums the engagement and impression columns in the database rather
+        than loading every row and summing attributes in Python; NULLIF
+        guards the division when there are no impressions yet.
+        """
+        rate = db.query(
+            (func.sum(cls.total_likes)
+             + func.sum(cls.total_retweets)
+             + func.sum(cls.total_replies))
+            * 100.0
+            / func.nullif(func.sum(cls.total_impressions), 0)
+        ).scalar()
+        return float(rate) if rate is not None else 0.0
+
 
 class PostingPattern(Base, TimestampMixin):
     """Analyze posting patterns for optimal timing."""
@@ -89,14 +106,14 @@ class PostingPattern(Base, TimestampMixin):
     day_of_week = Column(Integer, nullable=False)  # 0-6 (Monday-Sunday)
     
     # Performance metrics
-    avg_likes = Column(Float, default=0.0)
-    avg_retweets = Column(Float, default=0.0)
-    avg_replies = Column(Float, default=0.0)
-    avg_impressions = Column(Float, default=0.0)
-    avg_engagement_rate = Column(Float, default=0.0)
+    avg_likes = Column(Float, nullable=False, server_default=text("0"))
+    avg_retweets = Column(Float, nullable=False, server_default=text("0"))
+    avg_replies = Column(Float, nullable=False, server_default=text("0"))
+    avg_impressions = Column(Float, nullable=False, server_default=text("0"))
+    avg_engagement_rate = Column(Float, nullable=False, server_default=text("0"))
     
     # Sample size
-    tweet_count = Column(Integer, default=0)
+    tweet_count = Column(Integer, nullable=False, server_default=text("0"))
     
     # Last updated
     last_calculated = Column(DateTime(timezone=True), server_default=func.now())
@@ -125,7 +142,7 @@ class UserMetrics(Base, TimestampMixin):
     recorded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Additional data
-    extra_data = Column(JSON, nullable=True)
+    extra_data = Column(JSONValue, nullable=True)
     
     def __repr__(self) -> str:
         return f"<UserMetrics(type={self.metric_type}, value={self.metric_value}, time={self.recorded_at})>"
\ No newline at end of file
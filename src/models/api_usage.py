@@ -6,11 +6,11 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime,
-    JSON, Enum as SQLEnum, UniqueConstraint, Index
+    Enum as SQLEnum, UniqueConstraint, Index, text
 )
 from sqlalchemy.sql import func
 
-from src.models.base import Base, TimestampMixin
+from src.models.base import Base, TimestampMixin, JSONValue
 
 
 class APIProvider(str, Enum):
@@ -47,18 +47,18 @@ class APIUsage(Base, TimestampMixin):
     endpoint = Column(SQLEnum(APIEndpoint), nullable=False)
     
     # Usage details
-    request_count = Column(Integer, default=1)
+    request_count = Column(Integer, nullable=False, server_default=text("1"))
     tokens_used = Column(Integer, nullable=True)  # For OpenAI
     
     # Cost tracking
-    cost = Column(Float, default=0.0)
+    cost = Column(Float, nullable=False, server_default=text("0"))
     
     # Timestamp
     usage_date = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Request metadata
-    request_metadata = Column(JSON, nullable=True)
-    response_metadata = Column(JSON, nullable=True)
+    request_metadata = Column(JSONValue, nullable=True)
+    response_metadata = Column(JSONValue, nullable=True)
     
     # Indexes for efficient querying
     __table_args__ = (
@@ -86,11 +86,11 @@ class APIBudget(Base, TimestampMixin):
     budget_limit = Column(Float, nullable=False)
     
     # Current usage
-    current_spend = Column(Float, default=0.0)
-    request_count = Column(Integer, default=0)
+    current_spend = Column(Float, nullable=False, server_default=text("0"))
+    request_count = Column(Integer, nullable=False, server_default=text("0"))
     
     # Alert threshold (percentage)
-    alert_threshold = Column(Float, default=0.8)  # Alert at 80% by default
+    alert_threshold = Column(Float, nullable=False, server_default=text("0.8"))  # Alert at 80% by default
     alert_sent = Column(DateTime(timezone=True), nullable=True)
     
     __table_args__ = (
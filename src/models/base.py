@@ -1,11 +1,15 @@
 """Base database configuration and session management."""
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator
+from typing import Iterator
 
-from sqlalchemy import create_engine, Column, DateTime
+from sqlalchemy import create_engine, event, Column, DateTime, JSON
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.sql import func
 
 from src.core.config import settings
@@ -15,6 +19,11 @@ from src.core.config import settings
 Base = declarative_base()
 
 
+# JSON column type for all models: stock (text) JSON on SQLite, binary
+# JSONB on PostgreSQL so containment filters parse once, not per row
+JSONValue = JSON().with_variant(JSONB(), "postgresql")
+
+
 # Custom base class with common fields
 class TimestampMixin:
     """Mixin for adding created_at and updated_at timestamps."""
@@ -28,18 +37,70 @@ class TimestampMixin:
     )
 
 
-# Database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+# Database engine. QueuePool replaces SQLite's default SingletonThreadPool
+# so scheduler/worker threads reuse connections instead of opening a new
+# handle per session. Backend-specific knobs are keyed off the URL so the
+# same code path serves SQLite today and PostgreSQL if the URL changes.
+_url = make_url(settings.database_url)
+_backend = _url.get_backend_name()
+
+# Rows per page for insertmanyvalues (INSERT..RETURNING batching). Sized
+# to stay round-trip-efficient without ballooning statement size; bulk
+# callers can reuse it when chunking their own parameter lists
+INSERT_BATCH_SIZE = 50
+
+_engine_kwargs = {
+    "poolclass": QueuePool,
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "insertmanyvalues_page_size": INSERT_BATCH_SIZE,
+}
+if _backend == "sqlite":
+    _engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if not _url.database or ":memory:" in _url.database:
+        # An in-memory database lives inside one connection; pooling
+        # several would hand each caller its own empty schema
+        _engine_kwargs["poolclass"] = StaticPool
+        _engine_kwargs.pop("pool_size")
+        _engine_kwargs.pop("max_overflow")
+elif _backend == "postgresql":
+    # psycopg2 fast-execution helpers: multi-row VALUES pages instead of
+    # one INSERT round-trip per row on executemany workloads
+    _engine_kwargs["executemany_mode"] = "values_plus_batch"
+    _engine_kwargs["executemany_values_page_size"] = 1000
+    _engine_kwargs["executemany_batch_page_size"] = 500
+
+engine = create_engine(settings.database_url, **_engine_kwargs)
+
+
+if _backend == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+        """Apply per-connection PRAGMAs once, when the pool opens a handle."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local session registry for code paths that reuse one session per
+# thread instead of opening a fresh connection per call
+ScopedSession = scoped_session(SessionLocal)
+
+
+@contextmanager
+def get_db() -> Iterator[Session]:
+    """Yield a pooled database session, closing it on exit.
 
-def get_db() -> Generator[Session, None, None]:
-    """Get database session."""
+    Used as ``with get_db() as db:``; the session always goes back to
+    the connection pool, even when the block raises.
+    """
     db = SessionLocal()
     try:
         yield db
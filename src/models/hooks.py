@@ -1,10 +1,11 @@
 """Hook models for storing and managing high-performing tweet patterns."""
 
-from datetime import datetime
-from typing import Optional, Dict, List, Any
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Float, Boolean
-from sqlalchemy.orm import relationship
-from src.models.base import Base
+from operator import attrgetter
+from typing import Dict, Any
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Boolean, text
+from sqlalchemy.orm import column_property, relationship
+from sqlalchemy.sql import func
+from src.models.base import Base, JSONValue
 
 
 class HookTemplate(Base):
@@ -20,43 +21,45 @@ class HookTemplate(Base):
     structure_notes = Column(Text)  # Notes on how to structure content with this hook
     
     # Performance data
-    performance_metrics = Column(JSON)  # {'views': 100000, 'likes': 5000, 'engagement_rate': 5.2}
-    min_views = Column(Integer, default=0)  # Minimum views achieved
-    avg_engagement_rate = Column(Float, default=0.0)  # Average engagement rate
-    success_rate = Column(Float, default=0.0)  # Success rate when used (0-1)
+    performance_metrics = Column(JSONValue)  # {'views': 100000, 'likes': 5000, 'engagement_rate': 5.2}
+    min_views = Column(Integer, nullable=False, server_default=text("0"))  # Minimum views achieved
+    avg_engagement_rate = Column(Float, nullable=False, server_default=text("0"))  # Average engagement rate
+    success_rate = Column(Float, nullable=False, server_default=text("0"))  # Success rate when used (0-1)
     
     # Categorization
-    tags = Column(JSON)  # ['AI', 'automation', 'viral', 'tech']
-    use_cases = Column(JSON)  # ['product_launch', 'educational', 'news']
+    tags = Column(JSONValue)  # ['AI', 'automation', 'viral', 'tech']
+    use_cases = Column(JSONValue)  # ['product_launch', 'educational', 'news']
     target_audience = Column(String(100))  # 'developers', 'marketers', etc.
     
     # Metadata
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Server-side timestamps: the DB fills these in natively, so bulk
+    # insert paths don't have to materialize a datetime per row
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     source = Column(String(200))  # Where this hook came from
     
     # Relationships
-    usages = relationship("HookUsage", back_populates="hook_template", cascade="all, delete-orphan")
+    usages = relationship(
+        "HookUsage", back_populates="hook_template",
+        cascade="all, delete-orphan", lazy="selectin"
+    )
     
     def __repr__(self):
         return f"<HookTemplate(id={self.id}, type={self.pattern_type}, name={self.name})>"
     
+    # Precomputed key tuple + C-level attrgetter: bulk dict exports pay
+    # one zip per row instead of eleven attribute lookups in Python
+    _TO_DICT_KEYS = (
+        'id', 'pattern_type', 'name', 'hook_text', 'example_tweet',
+        'structure_notes', 'performance_metrics', 'tags', 'use_cases',
+        'success_rate', 'is_active'
+    )
+    _TO_DICT_GET = attrgetter(*_TO_DICT_KEYS)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert hook template to dictionary."""
-        return {
-            'id': self.id,
-            'pattern_type': self.pattern_type,
-            'name': self.name,
-            'hook_text': self.hook_text,
-            'example_tweet': self.example_tweet,
-            'structure_notes': self.structure_notes,
-            'performance_metrics': self.performance_metrics,
-            'tags': self.tags,
-            'use_cases': self.use_cases,
-            'success_rate': self.success_rate,
-            'is_active': self.is_active
-        }
+        return dict(zip(self._TO_DICT_KEYS, self._TO_DICT_GET(self)))
 
 
 class HookUsage(Base):
@@ -65,7 +68,7 @@ class HookUsage(Base):
     __tablename__ = 'hook_usage'
     
     id = Column(Integer, primary_key=True)
-    hook_id = Column(Integer, ForeignKey('hook_templates.id'), nullable=False)
+    hook_id = Column(Integer, ForeignKey('hook_templates.id'), nullable=False, index=True)
     tweet_id = Column(Integer, ForeignKey('tweets.id'), nullable=False)
     
     # How the hook was adapted
@@ -75,14 +78,19 @@ class HookUsage(Base):
     
     # Performance tracking
     performance_score = Column(Float)  # Performance score (0-10)
-    views = Column(Integer, default=0)
-    likes = Column(Integer, default=0)
-    retweets = Column(Integer, default=0)
-    replies = Column(Integer, default=0)
-    engagement_rate = Column(Float, default=0.0)
+    views = Column(Integer, nullable=False, server_default=text("0"))
+    likes = Column(Integer, nullable=False, server_default=text("0"))
+    retweets = Column(Integer, nullable=False, server_default=text("0"))
+    replies = Column(Integer, nullable=False, server_default=text("0"))
+    engagement_rate = Column(Float, nullable=False, server_default=text("0"))
     
     # Metadata
-    used_at = Column(DateTime, default=datetime.utcnow)
+    used_at = Column(DateTime, server_default=func.now())
+    # ISO-8601 rendering of used_at, formatted by SQLite's C strftime at
+    # load time so bulk exports skip Python-level datetime.isoformat
+    used_at_iso = column_property(
+        func.strftime('%Y-%m-%dT%H:%M:%S', used_at)
+    )
     feedback = Column(Text)  # User feedback on the hook usage
     
     # Relationships
@@ -92,17 +100,17 @@ class HookUsage(Base):
     def __repr__(self):
         return f"<HookUsage(id={self.id}, hook_id={self.hook_id}, tweet_id={self.tweet_id})>"
     
+    _TO_DICT_KEYS = (
+        'id', 'hook_id', 'tweet_id', 'adapted_content',
+        'performance_score', 'engagement_rate'
+    )
+    _TO_DICT_GET = attrgetter(*_TO_DICT_KEYS)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert hook usage to dictionary."""
-        return {
-            'id': self.id,
-            'hook_id': self.hook_id,
-            'tweet_id': self.tweet_id,
-            'adapted_content': self.adapted_content,
-            'performance_score': self.performance_score,
-            'engagement_rate': self.engagement_rate,
-            'used_at': self.used_at.isoformat() if self.used_at else None
-        }
+        result = dict(zip(self._TO_DICT_KEYS, self._TO_DICT_GET(self)))
+        result['used_at'] = self.used_at_iso
+        return result
 
 
 class HookCategory(Base):
@@ -113,10 +121,10 @@ class HookCategory(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(50), unique=True, nullable=False)
     description = Column(Text)
-    typical_performance = Column(JSON)  # Expected performance metrics
-    best_for = Column(JSON)  # Best use cases
-    examples = Column(JSON)  # Example patterns in this category
-    created_at = Column(DateTime, default=datetime.utcnow)
+    typical_performance = Column(JSONValue)  # Expected performance metrics
+    best_for = Column(JSONValue)  # Best use cases
+    examples = Column(JSONValue)  # Example patterns in this category
+    created_at = Column(DateTime, server_default=func.now())
     
     def __repr__(self):
         return f"<HookCategory(id={self.id}, name={self.name})>"
@@ -134,12 +142,17 @@ class HookPatternType:
     LIST = 'list'  # "10 X that Y"
     QUESTION = 'question'  # "Why does nobody talk about X?"
     STORY = 'story'  # Personal narrative hooks
-    
+
+    # Built once at class creation: the tuple for ordered iteration, the
+    # frozenset for O(1) membership checks, neither allocating per call
+    ALL_TYPES = (
+        SHOCK, VALUE_GIVEAWAY, AUTHORITY,
+        CONTRARIAN, INSIDER, RESULTS,
+        TIME_SENSITIVE, LIST, QUESTION, STORY
+    )
+    ALL_TYPES_SET = frozenset(ALL_TYPES)
+
     @classmethod
-    def all_types(cls) -> List[str]:
+    def all_types(cls) -> tuple:
         """Get all hook pattern types."""
-        return [
-            cls.SHOCK, cls.VALUE_GIVEAWAY, cls.AUTHORITY,
-            cls.CONTRARIAN, cls.INSIDER, cls.RESULTS,
-            cls.TIME_SENSITIVE, cls.LIST, cls.QUESTION, cls.STORY
-        ]
\ No newline at end of file
+        return cls.ALL_TYPES
\ No newline at end of file
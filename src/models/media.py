@@ -4,12 +4,13 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Float, Boolean,
-    ForeignKey, JSON, Enum as SQLEnum
+    Column, BigInteger, Integer, String, Text, Float, Boolean,
+    ForeignKey, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, validates
 
-from src.models.base import Base, TimestampMixin
+from src.models.base import Base, TimestampMixin, JSONValue
 
 
 class MediaType(str, Enum):
@@ -41,19 +42,21 @@ class Media(Base, TimestampMixin):
     file_size = Column(Integer, nullable=True)  # in bytes
     mime_type = Column(String(100), nullable=True)
     
-    # Media details
-    media_type = Column(SQLEnum(MediaType), nullable=False)
-    media_source = Column(SQLEnum(MediaSource), nullable=False)
+    # Media details; plain validated strings, see the validators below
+    media_type = Column(String(20), nullable=False)
+    media_source = Column(String(20), nullable=False)
     
-    # Dimensions (for images/videos)
-    width = Column(Integer, nullable=True)
-    height = Column(Integer, nullable=True)
-    duration = Column(Float, nullable=True)  # in seconds, for videos
+    # Dimensions (for images/videos), packed into one integer: width in
+    # bits 40-55, height in bits 24-39, duration in milliseconds in bits
+    # 0-23 (caps at ~4.6 hours, far beyond any tweet video). One column
+    # read replaces three, and the row stays ~12 bytes narrower; the
+    # hybrid properties below keep the old attribute API
+    dim_packed = Column(BigInteger, nullable=True)
     
     # Generation details (for AI-generated media)
     generation_prompt = Column(Text, nullable=True)
     generation_model = Column(String(50), nullable=True)
-    generation_cost = Column(Float, default=0.0)
+    generation_cost = Column(Float, nullable=False, server_default=text("0"))
     
     # Twitter media ID (after upload)
     twitter_media_id = Column(String(100), nullable=True)
@@ -62,19 +65,93 @@ class Media(Base, TimestampMixin):
     alt_text = Column(Text, nullable=True)
     
     # Metadata
-    extra_data = Column(JSON, nullable=True)
+    extra_data = Column(JSONValue, nullable=True)
     
     # Relationships
-    tweet_id = Column(Integer, ForeignKey("tweets.id"), nullable=True)
-    tweet = relationship("Tweet", back_populates="media_items")
+    tweet_id = Column(Integer, ForeignKey("tweets.id"), nullable=True, index=True)
+    # Scalar many-to-one: a joined load folds the parent into the same
+    # SELECT instead of a lazy query per media row
+    tweet = relationship("Tweet", back_populates="media_items", lazy="joined")
+
+    @hybrid_property
+    def width(self) -> Optional[int]:
+        """Media width in pixels."""
+        if self.dim_packed is None:
+            return None
+        return (self.dim_packed >> 40) & 0xFFFF
+
+    @width.setter
+    def width(self, value: Optional[int]) -> None:
+        if value is None:
+            return
+        packed = self.dim_packed or 0
+        self.dim_packed = (packed & ~(0xFFFF << 40)) | ((int(value) & 0xFFFF) << 40)
+
+    @width.expression
+    def width(cls):
+        return cls.dim_packed.op('>>')(40).op('&')(0xFFFF)
+
+    @hybrid_property
+    def height(self) -> Optional[int]:
+        """Media height in pixels."""
+        if self.dim_packed is None:
+            return None
+        return (self.dim_packed >> 24) & 0xFFFF
+
+    @height.setter
+    def height(self, value: Optional[int]) -> None:
+        if value is None:
+            return
+        packed = self.dim_packed or 0
+        self.dim_packed = (packed & ~(0xFFFF << 24)) | ((int(value) & 0xFFFF) << 24)
+
+    @height.expression
+    def height(cls):
+        return cls.dim_packed.op('>>')(24).op('&')(0xFFFF)
+
+    @hybrid_property
+    def duration(self) -> Optional[float]:
+        """Video duration in seconds."""
+        if self.dim_packed is None:
+            return None
+        return (self.dim_packed & 0xFFFFFF) / 1000.0
+
+    @duration.setter
+    def duration(self, value: Optional[float]) -> None:
+        if value is None:
+            return
+        packed = self.dim_packed or 0
+        self.dim_packed = (packed & ~0xFFFFFF) | (int(value * 1000) & 0xFFFFFF)
+
+    @duration.expression
+    def duration(cls):
+        return cls.dim_packed.op('&')(0xFFFFFF) / 1000.0
+
+    @validates('media_type')
+    def _validate_media_type(self, key, value):
+        """Coerce enum members or raw strings to the canonical value."""
+        return MediaType(value).value
+
+    @validates('media_source')
+    def _validate_media_source(self, key, value):
+        return MediaSource(value).value
     
     def __repr__(self) -> str:
         return f"<Media(id={self.id}, type={self.media_type}, source={self.media_source}, file={self.filename})>"
     
-    @property
+    # Shared frozenset: one hash probe per check, no list allocation
+    _AI_SOURCES = frozenset({MediaSource.DALL_E.value, MediaSource.POLLO_AI.value})
+
+    @hybrid_property
     def is_ai_generated(self) -> bool:
         """Check if media is AI-generated."""
-        return self.media_source in [MediaSource.DALL_E, MediaSource.POLLO_AI]
+        return self.media_source in self._AI_SOURCES
+
+    @is_ai_generated.expression
+    def is_ai_generated(cls):
+        return cls.media_source.in_(
+            (MediaSource.DALL_E.value, MediaSource.POLLO_AI.value)
+        )
     
     @property
     def is_video(self) -> bool:
@@ -1,14 +1,16 @@
 """Settings model for storing user preferences and configuration."""
 
 from enum import Enum
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean,
-    JSON, Enum as SQLEnum, Float
+    Float, Index, text
 )
+from sqlalchemy.orm import validates
 
-from src.models.base import Base, TimestampMixin
+from src.models.base import Base, TimestampMixin, JSONValue
 
 
 class SettingCategory(str, Enum):
@@ -21,6 +23,53 @@ class SettingCategory(str, Enum):
     STYLE = "style"
 
 
+# Default settings, built once at import; the read-only proxy guards
+# against callers mutating what is effectively a constant
+_DEFAULT_SETTINGS: Mapping[SettingCategory, Mapping[str, Any]] = MappingProxyType({
+    SettingCategory.GENERAL: MappingProxyType({
+        "timezone": "UTC",
+        "language": "en",
+        "theme": "dark",
+    }),
+    SettingCategory.POSTING: MappingProxyType({
+        "daily_post_target": 2,
+        "default_post_times": ["09:00", "17:00"],
+        "auto_approve": False,
+        "queue_size_limit": 50,
+        "retry_failed_posts": True,
+        "max_retry_attempts": 3,
+    }),
+    SettingCategory.AI: MappingProxyType({
+        "default_model": "gpt-4",
+        "temperature": 0.7,
+        "max_tokens": 280,
+        "include_hashtags": True,
+        "hashtag_count": 3,
+        "content_variations": 3,
+    }),
+    SettingCategory.MEDIA: MappingProxyType({
+        "auto_generate_images": False,
+        "image_style": "realistic",
+        "video_duration": 10,
+        "compress_media": True,
+        "max_file_size_mb": 15,
+    }),
+    SettingCategory.NOTIFICATIONS: MappingProxyType({
+        "posting_success": True,
+        "posting_failure": True,
+        "budget_alerts": True,
+        "daily_summary": True,
+        "weekly_report": True,
+    }),
+    SettingCategory.STYLE: MappingProxyType({
+        "writing_tone": "conversational",
+        "emoji_usage": "moderate",
+        "capitalization": "normal",
+        "punctuation_style": "standard",
+    })
+})
+
+
 class UserSettings(Base, TimestampMixin):
     """User settings and preferences."""
     
@@ -29,66 +78,39 @@ class UserSettings(Base, TimestampMixin):
     id = Column(Integer, primary_key=True, index=True)
     
     # Setting identification
-    category = Column(SQLEnum(SettingCategory), nullable=False, index=True)
+    category = Column(String(20), nullable=False, index=True)
     key = Column(String(100), nullable=False, unique=True, index=True)
     
     # Setting value (stored as JSON for flexibility)
-    value = Column(JSON, nullable=False)
+    value = Column(JSONValue, nullable=False)
     
     # Metadata
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
-    
+
+    # Covering index for the (category, key, is_active) lookups in
+    # get_setting/update_setting and the active-settings scan
+    __table_args__ = (
+        Index('idx_settings_category_key_active', 'category', 'key', 'is_active'),
+    )
+
+    @validates('category')
+    def _validate_category(self, key, value):
+        """Coerce enum members or raw strings to the canonical value."""
+        return SettingCategory(value).value
+
     def __repr__(self) -> str:
         return f"<UserSettings(category={self.category}, key={self.key}, value={self.value})>"
     
     @classmethod
-    def get_default_settings(cls) -> Dict[str, Dict[str, Any]]:
-        """Get default settings structure."""
-        return {
-            SettingCategory.GENERAL: {
-                "timezone": "UTC",
-                "language": "en",
-                "theme": "dark",
-            },
-            SettingCategory.POSTING: {
-                "daily_post_target": 2,
-                "default_post_times": ["09:00", "17:00"],
-                "auto_approve": False,
-                "queue_size_limit": 50,
-                "retry_failed_posts": True,
-                "max_retry_attempts": 3,
-            },
-            SettingCategory.AI: {
-                "default_model": "gpt-4",
-                "temperature": 0.7,
-                "max_tokens": 280,
-                "include_hashtags": True,
-                "hashtag_count": 3,
-                "content_variations": 3,
-            },
-            SettingCategory.MEDIA: {
-                "auto_generate_images": False,
-                "image_style": "realistic",
-                "video_duration": 10,
-                "compress_media": True,
-                "max_file_size_mb": 15,
-            },
-            SettingCategory.NOTIFICATIONS: {
-                "posting_success": True,
-                "posting_failure": True,
-                "budget_alerts": True,
-                "daily_summary": True,
-                "weekly_report": True,
-            },
-            SettingCategory.STYLE: {
-                "writing_tone": "conversational",
-                "emoji_usage": "moderate",
-                "capitalization": "normal",
-                "punctuation_style": "standard",
-            }
-        }
+    def get_default_settings(cls) -> Mapping[SettingCategory, Mapping[str, Any]]:
+        """Get default settings structure (shared read-only mapping)."""
+        return _DEFAULT_SETTINGS
 
+    @classmethod
+    def get_default_for(cls, category: SettingCategory) -> Mapping[str, Any]:
+        """Get the defaults for a single category."""
+        return _DEFAULT_SETTINGS[category]
 
 class StyleTemplate(Base, TimestampMixin):
     """Style templates for consistent content generation."""
@@ -106,8 +128,8 @@ class StyleTemplate(Base, TimestampMixin):
     voice = Column(String(50), nullable=False)
     
     # Content patterns
-    opening_patterns = Column(JSON, nullable=True)  # List of opening patterns
-    closing_patterns = Column(JSON, nullable=True)  # List of closing patterns
+    opening_patterns = Column(JSONValue, nullable=True)  # List of opening patterns
+    closing_patterns = Column(JSONValue, nullable=True)  # List of closing patterns
     
     # Language preferences
     vocabulary_level = Column(String(20), default="medium")  # simple, medium, advanced
@@ -115,16 +137,16 @@ class StyleTemplate(Base, TimestampMixin):
     
     # Formatting preferences
     use_emojis = Column(Boolean, default=True)
-    emoji_frequency = Column(Float, default=0.2)  # Emojis per tweet
+    emoji_frequency = Column(Float, nullable=False, server_default=text("0.2"))  # Emojis per tweet
     use_hashtags = Column(Boolean, default=True)
     hashtag_style = Column(String(20), default="lowercase")  # lowercase, CamelCase, UPPERCASE
     
     # Example tweets for reference
-    example_tweets = Column(JSON, nullable=True)  # List of example tweets
+    example_tweets = Column(JSONValue, nullable=True)  # List of example tweets
     
     # Usage tracking
     is_active = Column(Boolean, default=True)
-    times_used = Column(Integer, default=0)
+    times_used = Column(Integer, nullable=False, server_default=text("0"))
     
     def __repr__(self) -> str:
         return f"<StyleTemplate(name={self.name}, tone={self.tone}, voice={self.voice})>"
\ No newline at end of file
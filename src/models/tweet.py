@@ -5,12 +5,12 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean, 
-    ForeignKey, Float, JSON, Enum as SQLEnum
+    Column, Integer, String, Text, DateTime, Boolean,
+    ForeignKey, Float, Index, select, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
-from src.models.base import Base, TimestampMixin
+from src.models.base import Base, TimestampMixin, JSONValue
 
 
 class TweetStatus(str, Enum):
@@ -36,6 +36,19 @@ class ContentType(str, Enum):
     CUSTOM = "custom"
 
 
+# Precompiled lookup tables for the per-row validators below. A frozenset
+# probe is one hash lookup; going through TweetStatus(value) pays
+# EnumMeta.__call__ per row, which adds up on bulk inserts
+_VALID_STATUSES = frozenset(member.value for member in TweetStatus)
+_VALID_CONTENT_TYPES = frozenset(member.value for member in ContentType)
+
+# Statuses from which a tweet may still be sent; shared by can_be_posted
+# so the set is not rebuilt per property access
+_POSTABLE_STATUSES = frozenset(
+    (TweetStatus.APPROVED.value, TweetStatus.SCHEDULED.value)
+)
+
+
 class Tweet(Base, TimestampMixin):
     """Tweet model for storing tweet content and metadata."""
     
@@ -45,42 +58,91 @@ class Tweet(Base, TimestampMixin):
     
     # Content
     content = Column(Text, nullable=False)
-    content_type = Column(SQLEnum(ContentType), default=ContentType.PERSONAL)
+    content_type = Column(String(20), default=ContentType.PERSONAL.value)
     
-    # Scheduling
-    scheduled_time = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Scheduling; indexed by the partial index below, which only covers
+    # actionable rows
+    scheduled_time = Column(DateTime(timezone=True), nullable=True)
     posted_time = Column(DateTime(timezone=True), nullable=True)
     
-    # Status
-    status = Column(SQLEnum(TweetStatus), default=TweetStatus.DRAFT, index=True)
+    # Status; indexed via the composite (status, scheduled_time) index below.
+    # Plain strings validated against the enums below skip SQLAlchemy's
+    # per-row enum adapter on bulk fetches
+    status = Column(String(20), default=TweetStatus.DRAFT.value)
     
     # Generation metadata
     ai_generated = Column(Boolean, default=False)
     generation_prompt = Column(Text, nullable=True)
     generation_model = Column(String(50), nullable=True)
-    generation_cost = Column(Float, default=0.0)
+    generation_cost = Column(Float, nullable=False, server_default=text("0"))
     
     # Twitter metadata
     twitter_id = Column(String(100), nullable=True, unique=True)
     twitter_url = Column(String(255), nullable=True)
     
     # Engagement metrics (updated after posting)
-    likes_count = Column(Integer, default=0)
-    retweets_count = Column(Integer, default=0)
-    replies_count = Column(Integer, default=0)
-    impressions_count = Column(Integer, default=0)
+    likes_count = Column(Integer, nullable=False, server_default=text("0"))
+    retweets_count = Column(Integer, nullable=False, server_default=text("0"))
+    replies_count = Column(Integer, nullable=False, server_default=text("0"))
+    impressions_count = Column(Integer, nullable=False, server_default=text("0"))
     
     # Error handling
     error_message = Column(Text, nullable=True)
-    retry_count = Column(Integer, default=0)
+    retry_count = Column(Integer, nullable=False, server_default=text("0"))
     
     # Additional metadata
-    extra_data = Column(JSON, nullable=True)
+    extra_data = Column(JSONValue, nullable=True)
     
     # Relationships
-    media_items = relationship("Media", back_populates="tweet", cascade="all, delete-orphan")
-    hook_usage = relationship("HookUsage", back_populates="tweet", uselist=False)
-    
+    # selectin loading batches children into one IN() query per page of
+    # tweets instead of a lazy SELECT per row on first touch
+    media_items = relationship(
+        "Media", back_populates="tweet", cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    hook_usage = relationship(
+        "HookUsage", back_populates="tweet", uselist=False, lazy="selectin"
+    )
+
+    # Composite index so the due-now scheduler query (status=SCHEDULED,
+    # scheduled_time <= now, ordered by scheduled_time) is a range scan;
+    # the leading status column also serves plain status filters, so no
+    # separate single-column status index is kept. posted_time backs
+    # "what went out recently" analytics lookups.
+    # ix_tweet_active_scheduled only indexes tweets the scheduler can
+    # still act on, so it stays tiny however large the posted/cancelled
+    # backlog grows
+    # ix_tweet_ctype_status_sched serves content-type listings and the
+    # typed queue queries (content_type = ?, status = ?, ordered by
+    # scheduled_time) as one index seek.
+    __table_args__ = (
+        Index('ix_tweet_status_scheduled', 'status', 'scheduled_time'),
+        Index('ix_tweet_ctype_status_sched', 'content_type', 'status',
+              'scheduled_time'),
+        Index('ix_tweet_posted_time', 'posted_time'),
+        Index(
+            'ix_tweet_active_scheduled', 'scheduled_time',
+            sqlite_where=text(
+                "status IN ('scheduled', 'approved', 'pending_approval')"
+            ),
+        ),
+    )
+
+    @validates('status')
+    def _validate_status(self, key, value):
+        """Coerce enum members or raw strings to the canonical value."""
+        value = getattr(value, 'value', value)
+        if value not in _VALID_STATUSES:
+            raise ValueError(f"'{value}' is not a valid TweetStatus")
+        return value
+
+    @validates('content_type')
+    def _validate_content_type(self, key, value):
+        value = getattr(value, 'value', value)
+        if value not in _VALID_CONTENT_TYPES:
+            raise ValueError(f"'{value}' is not a valid ContentType")
+        return value
+
     def __repr__(self) -> str:
         return f"<Tweet(id={self.id}, status={self.status}, content='{self.content[:50]}...')>"
     
@@ -97,8 +159,37 @@ class Tweet(Base, TimestampMixin):
     @property
     def can_be_posted(self) -> bool:
         """Check if tweet can be posted."""
-        return self.status in [TweetStatus.APPROVED, TweetStatus.SCHEDULED]
+        return self.status in _POSTABLE_STATUSES
     
+    @classmethod
+    def list_projection(cls, db, **filters):
+        """Stream lightweight (id, content, status, scheduled_time) rows.
+
+        Listing views only read these four columns; Row tuples skip ORM
+        instance state and attribute instrumentation entirely, costing a
+        fraction of a full Tweet per row. Rows are streamed in blocks of
+        1000 so large listings never hold the whole table in memory.
+        """
+        return (
+            db.query(cls.id, cls.content, cls.status, cls.scheduled_time)
+            .filter_by(**filters)
+            .yield_per(1000)
+        )
+
+    @classmethod
+    def length_histogram(cls, db) -> dict:
+        """Character-length distribution over all tweets, computed in SQL.
+
+        One GROUP BY over length(content) replaces a Python loop calling
+        get_character_count per row; returns {length: tweet_count}.
+        """
+        from sqlalchemy import func
+        rows = db.execute(
+            select(func.length(cls.content), func.count())
+            .group_by(func.length(cls.content))
+        )
+        return dict(rows.all())
+
     def get_character_count(self) -> int:
         """Get character count for the tweet."""
         return len(self.content)
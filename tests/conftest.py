@@ -0,0 +1,66 @@
+"""Shared pytest fixtures for the test suite."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Tests don't need durability: run the whole session against an
+# in-memory shared-cache SQLite so commits cost microseconds instead of
+# fsyncs. Set before any src module (and therefore the engine) is
+# imported. Under xdist each worker process gets its own in-memory
+# database, which also provides per-worker isolation for free; script
+# invocations (python3 tests/test_*.py) bypass conftest and keep the
+# configured file-backed URL.
+os.environ.setdefault(
+    "DATABASE_URL", "sqlite:///file::memory:?cache=shared&uri=true"
+)
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def worker_id(request):
+    """The xdist worker id, or '' when running single-process."""
+    if hasattr(request.config, "workerinput"):
+        return request.config.workerinput["workerid"]
+    return ""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _initialized_database():
+    """Create schema and seed data once per session (per xdist worker)."""
+    from src.core.database import initialize_database
+
+    initialize_database()
+
+
+@pytest.fixture(scope="module")
+def sample_tweet():
+    """One created tweet shared by a module's lifecycle tests.
+
+    Creation and deletion each commit, so sharing one tweet per module
+    amortizes that cost across the update/schedule/approve assertions.
+    The tests using it are order-independent; under xdist each worker
+    process instantiates (and tears down) its own fixture tweet.
+    """
+    from src.core.tweet_manager import tweet_manager
+    from src.models import ContentType
+
+    tweet = tweet_manager.create_tweet(
+        content="This is a test tweet from X-Scheduler! 🚀 #testing",
+        content_type=ContentType.PERSONAL,
+    )
+    yield tweet
+    tweet_manager.delete_tweet(tweet.id, force=True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_generator_caches():
+    """Drop memoized generator state so tests never see stale stats."""
+    from src.core.content_generator import content_generator
+
+    content_generator.clear_caches()
+    yield
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 """Test authentication system functionality."""
 
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add src to path for imports
@@ -235,22 +237,26 @@ def test_file_security():
     try:
         from src.core.config import settings
         
-        # Check if credential files exist and have proper permissions
-        auth_key_file = Path(settings.data_dir) / ".auth_key"
-        credentials_file = Path(settings.data_dir) / ".credentials"
-        
-        for file_path in [auth_key_file, credentials_file]:
-            if file_path.exists():
+        # One scandir pass over the data directory replaces the per-file
+        # exists()/stat() pairs; DirEntry serves the cached stat result
+        try:
+            entries = {e.name: e for e in os.scandir(settings.data_dir)}
+        except FileNotFoundError:
+            entries = {}
+
+        for filename in [".auth_key", ".credentials"]:
+            entry = entries.get(filename)
+            if entry is not None:
                 # Check permissions (should be 0o600 - readable/writable by owner only)
-                file_mode = file_path.stat().st_mode & 0o777
+                file_mode = entry.stat().st_mode & 0o777
                 expected_mode = 0o600
-                
+
                 if file_mode == expected_mode:
-                    print(f"✓ {file_path.name} has correct permissions: {oct(file_mode)}")
+                    print(f"✓ {filename} has correct permissions: {oct(file_mode)}")
                 else:
-                    print(f"⚠ {file_path.name} has permissions: {oct(file_mode)} (expected {oct(expected_mode)})")
+                    print(f"⚠ {filename} has permissions: {oct(file_mode)} (expected {oct(expected_mode)})")
             else:
-                print(f"- {file_path.name} does not exist yet")
+                print(f"- {filename} does not exist yet")
         
     except Exception as e:
         print(f"✗ File security test failed: {e}")
@@ -258,16 +264,28 @@ def test_file_security():
 
 def main():
     """Run all authentication tests."""
+    # Buffer the status output and emit it in one stdout write at the
+    # end; the finally keeps it from being lost if a test blows up
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            _run_all()
+    finally:
+        sys.__stdout__.write(buffer.getvalue())
+
+
+def _run_all():
+    """Run every auth test section in order."""
     print("🚀 X-Scheduler Authentication System Tests")
     print("=" * 60)
-    
+
     test_credential_models()
-    test_credential_encryption() 
+    test_credential_encryption()
     test_auth_manager()
     test_api_clients()
     test_cost_calculations()
     test_file_security()
-    
+
     print("\n" + "=" * 60)
     print("🎉 Authentication tests completed!")
     print("\nTo test with real credentials:")
@@ -1,55 +1,122 @@
 #!/usr/bin/env python
 """Quick test script to verify CLI functionality."""
 
+import io
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
 
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def run_command(cmd: str) -> None:
-    """Run a CLI command and print the output."""
-    print(f"\n{'='*60}")
-    print(f"Running: {cmd}")
-    print('='*60)
-    
+from src.cli.main import cli
+
+# Driver for the Click-exiting commands (--version/--help): one child
+# interpreter imports the CLI once and dispatches every argv in turn, so
+# interpreter startup and the package import are paid once, not per
+# command
+_DRIVER = """\
+import sys
+import click
+from src.cli.main import cli
+
+for args in {argvs!r}:
+    print("\\n" + "=" * 60)
+    print("Running (driver): " + " ".join(args))
+    print("=" * 60)
+    try:
+        cli.main(list(args), standalone_mode=False)
+    except SystemExit as e:
+        if e.code not in (0, None):
+            print("Command failed with exit code: " + str(e.code))
+    except click.ClickException as e:
+        print("Error: " + e.format_message())
+        print("Command failed with exit code: " + str(e.exit_code))
+"""
+
+
+def run_driver(argvs: list) -> str:
+    """Run all argv lists through one subprocess and return its output."""
+    lines = []
     try:
         result = subprocess.run(
-            cmd.split(),
+            [sys.executable, "-c", _DRIVER.format(argvs=argvs)],
             capture_output=True,
             text=True,
             check=False
         )
-        
+
         if result.stdout:
-            print(result.stdout)
+            lines.append(result.stdout)
         if result.stderr:
-            print("STDERR:", result.stderr, file=sys.stderr)
-            
+            lines.append(f"STDERR: {result.stderr}")
+
         if result.returncode != 0:
-            print(f"Command failed with return code: {result.returncode}")
+            lines.append(f"Driver failed with return code: {result.returncode}")
+    except Exception as e:
+        lines.append(f"Error running driver: {e}")
+
+    return "\n".join(lines)
+
+
+def run_in_process(args: list) -> str:
+    """Invoke the Click group directly, skipping interpreter startup.
+
+    Dispatching through the already-imported ``cli`` object avoids paying
+    a fresh Python + SQLAlchemy + Click import per command; stdout/stderr
+    are captured so output formatting matches the subprocess path.
+    """
+    lines = [f"\n{'='*60}", f"Running (in-process): {' '.join(args)}", '='*60]
+
+    buf, ebuf = io.StringIO(), io.StringIO()
+    try:
+        with redirect_stdout(buf), redirect_stderr(ebuf):
+            cli.main(args, standalone_mode=False)
+    except SystemExit as e:
+        if e.code not in (0, None):
+            lines.append(f"Command failed with exit code: {e.code}")
     except Exception as e:
-        print(f"Error running command: {e}")
+        lines.append(f"Error running command: {e}")
+
+    if buf.getvalue():
+        lines.append(buf.getvalue())
+    if ebuf.getvalue():
+        lines.append(f"STDERR: {ebuf.getvalue()}")
+
+    return "\n".join(lines)
 
 
 def main():
     """Test various CLI commands."""
-    commands = [
-        "python -m src.cli.main --version",
-        "python -m src.cli.main --help",
-        "python -m src.cli.main generate --help",
-        "python -m src.cli.main init",
-        "python -m src.cli.main queue list",
-        "python -m src.cli.main stats --period week",
+    # Real commands dispatch in-process through the imported Click group —
+    # no interpreter cold start per invocation. init still runs first
+    # since it creates the database queue/stats read. Output redirection
+    # is process-global, so these run serially
+    in_process_commands = [
+        ["init"],
+        ["queue", "list"],
+        ["stats", "--period", "week"],
     ]
-    
+    # --version and --help print via Click and exit, so they run in a
+    # child interpreter — but all through one driver process
+    driver_commands = [
+        ["--version"],
+        ["--help"],
+        ["generate", "--help"],
+    ]
+
     print("Testing X-Scheduler CLI...")
-    
-    for cmd in commands:
-        run_command(cmd)
-    
+
+    for args in in_process_commands:
+        print(run_in_process(args))
+
+    print(run_driver(driver_commands))
+
     print("\n" + "="*60)
     print("CLI test complete!")
     print("="*60)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
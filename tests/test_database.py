@@ -8,6 +8,8 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import insert
+
 from src.models import (
     get_db, init_db,
     Tweet, TweetStatus, ContentType,
@@ -39,68 +41,72 @@ def test_database():
     
     # Test tweet creation
     print("\n3. Testing tweet creation...")
-    db = next(get_db())
-    
-    try:
-        tweet = Tweet(
-            content="This is a test tweet from X-Scheduler! 🚀",
-            content_type=ContentType.PERSONAL,
-            scheduled_time=datetime.now() + timedelta(hours=1),
-            status=TweetStatus.SCHEDULED,
-            ai_generated=True,
-            generation_prompt="Test prompt",
-            generation_model="gpt-4"
-        )
-        db.add(tweet)
-        db.commit()
-        print(f"✓ Created tweet: {tweet}")
-        
-        # Test media creation
-        print("\n4. Testing media creation...")
-        media = Media(
-            filename="test_image.png",
-            file_path="/data/media/test_image.png",
-            media_type=MediaType.IMAGE,
-            media_source=MediaSource.DALL_E,
-            generation_prompt="A beautiful sunset",
-            generation_cost=0.02,
-            tweet_id=tweet.id
-        )
-        db.add(media)
-        db.commit()
-        print(f"✓ Created media: {media}")
-        
-        # Test daily stats
-        print("\n5. Testing daily stats...")
-        today_stats = DailyStats(
-            stat_date=datetime.now().date(),
-            tweets_posted=5,
-            tweets_scheduled=10,
-            total_likes=50,
-            total_retweets=20,
-            followers_count=1000,
-            followers_gained=10
-        )
-        db.add(today_stats)
-        db.commit()
-        print(f"✓ Created daily stats: {today_stats}")
-        print(f"  Engagement rate: {today_stats.engagement_rate:.2f}%")
+    with get_db() as db:
+        try:
+            # Core inserts bypass the unit of work; RETURNING hands back
+            # the generated ids in the same round-trip so the media rows
+            # can reference them. Everything lands in a single commit.
+            tweet_rows = [{
+                "content": "This is a test tweet from X-Scheduler! 🚀",
+                "content_type": ContentType.PERSONAL,
+                "scheduled_time": datetime.now() + timedelta(hours=1),
+                "status": TweetStatus.SCHEDULED,
+                "ai_generated": True,
+                "generation_prompt": "Test prompt",
+                "generation_model": "gpt-4"
+            }]
+            tweet_ids = db.execute(
+                insert(Tweet).returning(Tweet.id), tweet_rows
+            ).scalars().all()
+            print(f"✓ Created tweet: id={tweet_ids[0]}")
+
+            # Test media creation
+            print("\n4. Testing media creation...")
+            media_rows = [{
+                "filename": "test_image.png",
+                "file_path": "/data/media/test_image.png",
+                "media_type": MediaType.IMAGE,
+                "media_source": MediaSource.DALL_E,
+                "generation_prompt": "A beautiful sunset",
+                "generation_cost": 0.02,
+                "tweet_id": tweet_ids[0]
+            }]
+            db.execute(insert(Media), media_rows)
+            print(f"✓ Created media: {media_rows[0]['filename']}")
+
+            # Test daily stats
+            print("\n5. Testing daily stats...")
+            stats_rows = [{
+                "stat_date": datetime.now().date(),
+                "tweets_posted": 5,
+                "tweets_scheduled": 10,
+                "total_likes": 50,
+                "total_retweets": 20,
+                "followers_count": 1000,
+                "followers_gained": 10
+            }]
+            db.execute(insert(DailyStats), stats_rows)
+            db.commit()
+
+            today_stats = db.query(DailyStats).filter_by(
+                stat_date=stats_rows[0]["stat_date"]
+            ).first()
+            print(f"✓ Created daily stats: {today_stats}")
+            print(f"  Engagement rate: {today_stats.engagement_rate:.2f}%")
         
-        # Query tweets
-        print("\n6. Testing queries...")
-        scheduled_tweets = db.query(Tweet).filter_by(status=TweetStatus.SCHEDULED).all()
-        print(f"✓ Found {len(scheduled_tweets)} scheduled tweets")
+            # Query tweets
+            print("\n6. Testing queries...")
+            scheduled_tweets = list(Tweet.list_projection(db, status=TweetStatus.SCHEDULED))
+            print(f"✓ Found {len(scheduled_tweets)} scheduled tweets")
         
-        # Query settings
-        all_settings = db.query(UserSettings).all()
-        print(f"✓ Found {len(all_settings)} settings")
+            # Query settings
+            all_settings = db.query(UserSettings).all()
+            print(f"✓ Found {len(all_settings)} settings")
         
-    except Exception as e:
-        db.rollback()
-        print(f"✗ Error: {e}")
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            db.rollback()
+            print(f"✗ Error: {e}")
+            raise
     
     print("\n" + "=" * 60)
     print("Database tests completed successfully!")